@@ -0,0 +1,95 @@
+"""
+In-process cache of loaded Stellar accounts, so consecutive transactions from
+the same source do not reload the account from Horizon each time.
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from ratelimit import HORIZON_BUCKET
+
+# Public key -> (Account, fetched_at)
+_cache = {}
+
+def get_account(server, public_key: str, ttl: float = 5.0):
+    """
+    Return the Account for public_key, reusing one loaded within the last ttl seconds.
+    
+    TransactionBuilder.build() advances the cached Account's sequence number, so
+    a cached entry stays valid across consecutive submissions. Call invalidate()
+    when a submission fails so the next call reloads it from Horizon.
+    
+    Args:
+        server (Server): Horizon server used when the account has to be loaded
+        public_key (str): The public key of the account
+        ttl (float): Seconds a loaded account may be reused
+        
+    Returns:
+        Account: The source account
+    """
+    cached = _cache.get(public_key)
+    if cached and time.monotonic() - cached[1] < ttl:
+        return cached[0]
+    
+    HORIZON_BUCKET.acquire()
+    account = server.load_account(public_key)
+    _cache[public_key] = (account, time.monotonic())
+    return account
+
+def existing_trustlines(account) -> set:
+    """
+    Return the trustlines an account already holds.
+    
+    Args:
+        account (Account): Account returned by get_account() or load_accounts_bulk()
+        
+    Returns:
+        set: (asset_code, asset_issuer) pairs for every non-native balance
+    """
+    balances = (getattr(account, 'raw_data', None) or {}).get('balances', [])
+    return {
+        (balance['asset_code'], balance['asset_issuer'])
+        for balance in balances
+        if balance.get('asset_type') not in ('native', 'liquidity_pool_shares')
+    }
+
+def invalidate(public_key: str):
+    """Drop the cached account for public_key."""
+    _cache.pop(public_key, None)
+
+def load_accounts_bulk(server, public_keys: list, max_workers: int = 8) -> dict:
+    """
+    Load several accounts from Horizon concurrently and cache them.
+    
+    Accounts that fail to load are left out of the result.
+    
+    Args:
+        server (Server): Horizon server to load the accounts from
+        public_keys (list): Public keys of the accounts to load
+        max_workers (int): Maximum number of concurrent requests
+        
+    Returns:
+        dict: Public key -> Account for every account that loaded
+    """
+    if len(public_keys) == 1:
+        try:
+            return {public_keys[0]: get_account(server, public_keys[0], ttl=0)}
+        except Exception as e:
+            print(f"Error loading account {public_keys[0]}: {e}")
+            return {}
+    
+    def load(public_key):
+        HORIZON_BUCKET.acquire()
+        return server.load_account(public_key)
+    
+    accounts = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(load, public_key): public_key for public_key in set(public_keys)}
+        for future in as_completed(futures):
+            public_key = futures[future]
+            try:
+                accounts[public_key] = future.result()
+            except Exception as e:
+                print(f"Error loading account {public_key}: {e}")
+                continue
+            _cache[public_key] = (accounts[public_key], time.monotonic())
+    return accounts
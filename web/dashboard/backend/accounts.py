@@ -1,13 +1,10 @@
 import json
 import os
-import time
+import asyncio
 from stellar_sdk import Keypair, Server
-import requests
-from dotenv import load_dotenv
+import config  # Loads .env once per process
 from error_handler import check_account_balance
-
-# Load environment variables
-load_dotenv()
+from trading_account import fund_account_with_friendbot, fund_accounts_with_friendbot
 
 KEYPAIRS_FILE = os.path.join("data", "keypairs.json")
 
@@ -31,6 +28,26 @@ def save_keypairs(keypairs: list):
     with open(KEYPAIRS_FILE, 'w') as f:
         json.dump([{'public_key': kp.public_key, 'secret': kp.secret} for kp in keypairs], f, indent=4)
 
+def _xlm_balance(public_key: str) -> float:
+    """
+    Look up an account's XLM balance.
+    
+    Args:
+        public_key (str): The public key of the account to check
+        
+    Returns:
+        float: The XLM balance, or None if it could not be checked
+    """
+    horizon_url = os.getenv('STELLAR_HORIZON_URL', 'https://horizon-testnet.stellar.org')
+    
+    balance_info = check_account_balance(public_key, horizon_url)
+    if "error" in balance_info:
+        print(f"Error checking balance for {public_key}: {balance_info['error']}")
+        return None
+        
+    print(f"Account {public_key} balance: {balance_info['xlm_balance']} XLM")
+    return balance_info['xlm_balance']
+
 def ensure_account_funded(public_key: str, min_balance: float = 10.0) -> bool:
     """
     Check if an account has sufficient balance and fund it if needed.
@@ -42,38 +59,15 @@ def ensure_account_funded(public_key: str, min_balance: float = 10.0) -> bool:
     Returns:
         bool: True if account is properly funded, False otherwise
     """
-    horizon_url = os.getenv('STELLAR_HORIZON_URL', 'https://horizon-testnet.stellar.org')
-    
     try:
-        # Check current balance
-        balance_info = check_account_balance(public_key, horizon_url)
-        if "error" in balance_info:
-            print(f"Error checking balance for {public_key}: {balance_info['error']}")
+        current_balance = _xlm_balance(public_key)
+        if current_balance is None:
             return False
-            
-        current_balance = balance_info['xlm_balance']
-        print(f"Account {public_key} balance: {current_balance} XLM")
-        
         if current_balance >= min_balance:
             return True
             
-        # If balance is too low, try to fund it
-        print(f"Funding account {public_key} with Friendbot...")
-        response = requests.get(f"https://friendbot.stellar.org?addr={public_key}")
-        response.raise_for_status()
-        
-        if response.status_code == 200:
-            print(f"SUCCESS! Account {public_key} funded.")
-            # Wait a moment for the funding to propagate
-            time.sleep(2)
-            return True
-        else:
-            print(f"ERROR! Could not fund account {public_key}. Response: \n{response.text}")
-            return False
-            
-    except requests.exceptions.RequestException as e:
-        print(f"Network error while funding account {public_key}: {e}")
-        return False
+        # If balance is too low, fund it over the shared Friendbot session
+        return fund_account_with_friendbot(public_key)
     except Exception as e:
         print(f"Error checking/funding account {public_key}: {e}")
         return False
@@ -89,33 +83,30 @@ def create_and_fund_accounts(num_accounts: int = None) -> list:
     keypairs = load_keypairs()
     print(f"Loaded {len(keypairs)} existing accounts.")
 
-    # First, ensure all existing accounts are properly funded
+    # Find existing accounts below 5 XLM so they can be funded with the new ones
+    to_fund = []
     for i, keypair in enumerate(keypairs):
-        public_key = keypair.public_key
-        print(f"Checking funding for existing account #{i+1}: {public_key}")
-        if not ensure_account_funded(public_key, 5.0):  # Ensure at least 5 XLM
-            print(f"Warning: Could not ensure funding for account {public_key}")
-
-    # Create new accounts if needed
-    while len(keypairs) < num_accounts:
-        new_keypair = Keypair.random()
-        public_key = new_keypair.public_key
-        print(f"Creating and funding new account #{len(keypairs) + 1} with public key: {public_key}")
-
+        print(f"Checking funding for existing account #{i+1}: {keypair.public_key}")
         try:
-            response = requests.get(f"https://friendbot.stellar.org?addr={public_key}")
-            response.raise_for_status()
-            if response.status_code == 200:
-                print(f"SUCCESS! Account #{len(keypairs) + 1} funded.")
-                keypairs.append(new_keypair)
-                save_keypairs(keypairs)
-                # Wait a moment for the funding to propagate
-                time.sleep(2)
-            else:
-                print(f"ERROR! Could not fund account. Response: \n{response.text}")
-        except requests.exceptions.RequestException as e:
-            print(f"An error occurred while funding account: {e}")
-            # Don't add the keypair if funding failed
-            break
+            current_balance = _xlm_balance(keypair.public_key)
+        except Exception as e:
+            print(f"Warning: Could not check funding for account {keypair.public_key}: {e}")
+            continue
+        if current_balance is not None and current_balance < 5.0:
+            to_fund.append(keypair.public_key)
+
+    # Create new accounts if needed and fund everything in one concurrent batch
+    missing = num_accounts - len(keypairs)
+    new_keypairs = [Keypair.random() for _ in range(max(missing, 0))]
+    to_fund.extend(kp.public_key for kp in new_keypairs)
+    if to_fund:
+        print(f"Funding {len(to_fund)} accounts, {len(new_keypairs)} of them new...")
+        funded = asyncio.run(fund_accounts_with_friendbot(to_fund))
+        for public_key, ok in funded.items():
+            if not ok:
+                print(f"Warning: Could not ensure funding for account {public_key}")
+    if new_keypairs:
+        keypairs.extend(kp for kp in new_keypairs if funded[kp.public_key])
+        save_keypairs(keypairs)
             
     return keypairs
\ No newline at end of file
@@ -2,15 +2,12 @@ import time
 import os
 import random
 import asyncio
-from dotenv import load_dotenv
+import config  # Loads .env once per process
 from contract_client import ContractClient
 from error_handler import check_account_balance, ensure_sufficient_fee
 from trading_account import load_trading_account, ensure_sufficient_xlm
 from stellar_sdk import Asset
 
-# Load environment variables
-load_dotenv()
-
 async def run_arbitrage_engine(accounts: list, assets=None):
     """
     Continuously scans for and executes arbitrage opportunities using the Soroban smart contract.
@@ -125,6 +122,7 @@ async def run_arbitrage_engine(accounts: list, assets=None):
         await asyncio.sleep(scan_interval)
 
 if __name__ == "__main__":
+    config.configure_script_logging()
     async def run_sync():
         async for message in run_arbitrage_engine(accounts=[]):
             print(message)
@@ -1,11 +1,12 @@
 import os
-from dotenv import load_dotenv
+import config  # Loads .env once per process
 from stellar_sdk import Asset, Server, TransactionBuilder, Network
 from contract_client import ContractClient
 from trading_account import load_trading_account
+from account_cache import get_account, load_accounts_bulk, existing_trustlines
+from tx_cache import envelope_key, submit_cached
 
-# Load environment variables
-load_dotenv()
+NETWORK_PASSPHRASE = os.getenv('STELLAR_NETWORK_PASSPHRASE', 'Test SDF Network ; September 2015')
 
 def create_assets_and_trustlines(accounts: list) -> list:
     """
@@ -13,7 +14,6 @@ def create_assets_and_trustlines(accounts: list) -> list:
     Note: Real assets are already issued, we just need trustlines.
     """
     horizon_url = os.getenv('STELLAR_HORIZON_URL', 'https://horizon-testnet.stellar.org')
-    network_passphrase = os.getenv('STELLAR_NETWORK_PASSPHRASE', 'Test SDF Network ; September 2015')
     
     contract_client = ContractClient()
     if accounts:
@@ -34,35 +34,53 @@ def create_assets_and_trustlines(accounts: list) -> list:
 
     server = Server(horizon_url)
     
-    # Establish trustlines for real assets
-    for asset in real_assets:
-        for account_keypair in accounts:
-            print(f"Processing asset {asset.code} for {account_keypair.public_key}")
-            
-            try:
-                source_account = server.load_account(account_keypair.public_key)
-            except Exception as e:
-                print(f"Error loading account {account_keypair.public_key}: {e}")
-                continue
+    # Load every source account up front instead of one request per loop iteration
+    source_accounts = load_accounts_bulk(server, [account_keypair.public_key for account_keypair in accounts])
+    
+    # Establish trustlines for real assets, one transaction per account
+    for account_keypair in accounts:
+        try:
+            source_account = source_accounts.pop(account_keypair.public_key, None) or get_account(server, account_keypair.public_key)
+        except Exception as e:
+            print(f"Error loading account {account_keypair.public_key}: {e}")
+            continue
+        
+        # Only submit trustlines the account does not already have
+        existing = existing_trustlines(source_account)
+        missing_assets = [asset for asset in real_assets if (asset.code, asset.issuer) not in existing]
+        if not missing_assets:
+            print(f"All trustlines already established for {account_keypair.public_key}")
+            continue
+        
+        print(f"Processing assets {', '.join(asset.code for asset in missing_assets)} for {account_keypair.public_key}")
+        
+        # Reuse the signed envelope if an earlier attempt at this sequence never applied
+        key = envelope_key(
+            account_keypair.public_key, source_account.sequence + 1, "change_trust", "10000000",
+            *(f"{asset.code}:{asset.issuer}" for asset in missing_assets)
+        )
+        
+        def build():
+            # Build transaction to establish every trustline at once
+            builder = TransactionBuilder(
+                source_account=source_account,
+                network_passphrase=NETWORK_PASSPHRASE,
+                base_fee=100,
+            ).set_timeout(30)
             
-            try:
-                # Build transaction to establish trustline
-                builder = TransactionBuilder(
-                    source_account=source_account,
-                    network_passphrase=network_passphrase,
-                    base_fee=100,
-                ).set_timeout(30)
-                
+            for asset in missing_assets:
                 builder.append_change_trust_op(asset=asset, limit="10000000")
-                tx = builder.build()
-                tx.sign(account_keypair)
-                
-                response = server.submit_transaction(tx)
-                print(f"Trustline response: {response}")
-            except Exception as e:
-                print(f"Error establishing trustline: {e}")
-                # If trustline already exists, we can ignore the error and proceed
-                if "op_already_exists" not in str(e):
-                    continue
+            tx = builder.build()
+            tx.sign(account_keypair)
+            return tx
+        
+        try:
+            response = submit_cached(
+                key, NETWORK_PASSPHRASE, account_keypair.public_key, source_account, build,
+                server.submit_transaction
+            )
+            print(f"Trustline response: {response}")
+        except Exception as e:
+            print(f"Error establishing trustlines: {e}")
 
     return real_assets
\ No newline at end of file
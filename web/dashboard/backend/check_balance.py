@@ -19,7 +19,7 @@ def main():
     # Check account balance
     result = check_account_balance(trading_account.public_key)
     
-    print(f"Full result: {json.dumps(result, indent=2)}")
+    print(f"Full result: {json.dumps(result, indent=2, default=str)}")
     
     if "error" in result:
         print(f"Error checking balance: {result['error']}")
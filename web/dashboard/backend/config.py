@@ -0,0 +1,17 @@
+"""
+Process-wide configuration: loads the .env file once, the first time this module is imported.
+
+Modules that read settings from the environment do `import config` before calling os.getenv,
+and standalone scripts call config.configure_script_logging() from their __main__ block.
+"""
+
+import logging
+import os
+import sys
+from dotenv import load_dotenv
+
+load_dotenv()
+
+def configure_script_logging():
+    """Send log records to stdout as bare messages, at the level named by LOGLEVEL (default INFO)."""
+    logging.basicConfig(level=os.getenv("LOGLEVEL", "INFO"), format="%(message)s", stream=sys.stdout)
@@ -1,15 +1,13 @@
 import os
 import time
-from dotenv import load_dotenv
-from stellar_sdk import Keypair, Network, Server
+import config  # Loads .env once per process
+from stellar_sdk import Account, Keypair, Network, Server
 from stellar_sdk.soroban_server import SorobanServer
 from stellar_sdk.transaction_builder import TransactionBuilder
 from stellar_sdk.xdr import SCVal, SCVec, SCValType, SCString, Int64
 from stellar_sdk.address import Address
 from error_handler import decode_stellar_error, check_account_balance, ensure_sufficient_fee
-
-# Load environment variables
-load_dotenv()
+from concurrent.futures import ThreadPoolExecutor
 
 class ContractClient:
     def __init__(self):
@@ -232,39 +230,7 @@ class ContractClient:
             sim_response = self.server.simulate_transaction(tx)
 
             if sim_response.results:
-                result_xdr = sim_response.results[0].xdr
-                scval = SCVal.from_xdr(result_xdr)
-                # Handle SCVal parsing correctly for vectors
-                if scval.type == SCValType.SCV_VEC and scval.vec is not None:
-                    assets = []
-                    for vec_element in scval.vec.sc_vec:
-                        # Parse each asset in the vector
-                        if vec_element.type == SCValType.SCV_MAP and vec_element.map is not None:
-                            asset_dict = {}
-                            for map_entry in vec_element.map.sc_map:
-                                # Extract key and value
-                                key = map_entry.key
-                                value = map_entry.val
-                                
-                                # Parse key (should be string)
-                                if key.type == SCValType.SCV_STRING:
-                                    key_str = key.str.sc_string.decode('utf-8')
-                                    
-                                    # Parse value based on type
-                                    if value.type == SCValType.SCV_STRING:
-                                        value_str = value.str.sc_string.decode('utf-8')
-                                        asset_dict[key_str] = value_str
-                                    elif value.type == SCValType.SCV_ADDRESS:
-                                        # Convert address to string
-                                        address_obj = Address.from_xdr_sc_address(value.address)
-                                        asset_dict[key_str] = str(address_obj)
-                            
-                            if asset_dict:
-                                assets.append(asset_dict)
-                    return assets
-                else:
-                    print(f"Unexpected SCVal type or no vector: {scval.type}")
-                    return []
+                return self._parse_supported_assets(SCVal.from_xdr(sim_response.results[0].xdr))
             else:
                 print("Simulation successful but no results returned")
                 return []
@@ -275,6 +241,88 @@ class ContractClient:
             traceback.print_exc()
             return []
 
+    def _parse_supported_assets(self, scval: SCVal) -> list:
+        """Convert the get_supported_assets result vector into a list of asset dicts."""
+        if scval.type == SCValType.SCV_VEC and scval.vec is not None:
+            assets = []
+            for vec_element in scval.vec.sc_vec:
+                # Parse each asset in the vector
+                if vec_element.type == SCValType.SCV_MAP and vec_element.map is not None:
+                    asset_dict = {}
+                    for map_entry in vec_element.map.sc_map:
+                        # Extract key and value
+                        key = map_entry.key
+                        value = map_entry.val
+                        
+                        # Parse key (should be string)
+                        if key.type == SCValType.SCV_STRING:
+                            key_str = key.str.sc_string.decode('utf-8')
+                            
+                            # Parse value based on type
+                            if value.type == SCValType.SCV_STRING:
+                                value_str = value.str.sc_string.decode('utf-8')
+                                asset_dict[key_str] = value_str
+                            elif value.type == SCValType.SCV_ADDRESS:
+                                # Convert address to string
+                                address_obj = Address.from_xdr_sc_address(value.address)
+                                asset_dict[key_str] = str(address_obj)
+                    
+                    if asset_dict:
+                        assets.append(asset_dict)
+            return assets
+        else:
+            print(f"Unexpected SCVal type or no vector: {scval.type}")
+            return []
+
+    def simulate_batch(self, trader_keypair: Keypair, calls: list) -> list:
+        """
+        Simulate several read-only ArbitrageDetector calls concurrently.
+        
+        Soroban only allows one host function invocation per transaction, so each
+        call gets its own transaction; the source account is loaded once and the
+        simulations run in parallel.
+        
+        Args:
+            trader_keypair (Keypair): Source account for the simulated transactions
+            calls (list): (function_name, parameters) tuples, parameters being SCVal lists
+            
+        Returns:
+            list: The result SCVal for each call, or None where the simulation failed
+        """
+        if not self.arbitrage_contract_id or not self.server:
+            print("Error: Contract ID or Soroban server connection not available")
+            return [None] * len(calls)
+        
+        try:
+            sequence = self.horizon_server.load_account(trader_keypair.public_key).sequence
+        except Exception as e:
+            print(f"Error loading account {trader_keypair.public_key}: {e}")
+            return [None] * len(calls)
+        
+        def simulate(call):
+            function_name, parameters = call
+            try:
+                tx = (
+                    TransactionBuilder(Account(trader_keypair.public_key, sequence), self.network_passphrase, base_fee=100)
+                    .set_timeout(300)
+                    .append_invoke_contract_function_op(
+                        contract_id=self.arbitrage_contract_id,
+                        function_name=function_name,
+                        parameters=parameters,
+                    )
+                    .build()
+                )
+                sim_response = self.server.simulate_transaction(tx)
+                if sim_response.results:
+                    return SCVal.from_xdr(sim_response.results[0].xdr)
+                print(f"Simulation of {function_name} returned no results: {getattr(sim_response, 'error', None)}")
+            except Exception as e:
+                print(f"Error simulating {function_name}: {e}")
+            return None
+        
+        with ThreadPoolExecutor(max_workers=len(calls) or 1) as executor:
+            return list(executor.map(simulate, calls))
+
     def scan_opportunities(self, trader_keypair: Keypair, assets=None, min_profit=0):
         """Calls the scan_opportunities function on the ArbitrageDetector contract."""
         if not self.arbitrage_contract_id:
@@ -1,9 +1,34 @@
 import base64
 import time
-from stellar_sdk import Server
+import functools
+from decimal import Decimal
+from concurrent.futures import ThreadPoolExecutor
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from stellar_sdk import Server, __version__ as stellar_sdk_version
+from stellar_sdk.client.requests_client import RequestsClient
 from stellar_sdk.exceptions import BadRequestError, NotFoundError
 from stellar_sdk.xdr import TransactionResult, TransactionResultCode
 
+def _operation_result_code(op_result):
+    """
+    Name the operation-specific result code of an operation result, e.g. CHANGE_TRUST_NO_ISSUER.
+    
+    Args:
+        op_result (OperationResult): One entry of a TransactionResult's results
+        
+    Returns:
+        str: The inner result code name, or the outer code name (e.g. opBAD_AUTH) when there is no inner result
+    """
+    tr = op_result.tr
+    if tr is not None:
+        # Only the arm for tr.type (change_trust_result, payment_result, ...) is set
+        for name, arm in vars(tr).items():
+            if name != "type" and arm is not None:
+                return arm.code.name
+    return op_result.code.name
+
 def decode_stellar_error(error_xdr):
     """
     Decode Stellar error XDR to understand specific failure reasons.
@@ -25,32 +50,92 @@ def decode_stellar_error(error_xdr):
         result = TransactionResult.from_xdr_bytes(xdr_bytes)
         
         # Extract error code
-        result_code = result.result.code
+        inner = result.result
+        result_code = getattr(inner, 'code', None)
+        op_results = getattr(inner, 'results', None)
         error_info = {
             "result_code": str(result_code),
             "inner_code": None
         }
         
         # Get more specific error information if available
-        if hasattr(result.result, 'results') and result.result.results:
+        if op_results:
             # Operation-specific errors
-            op_results = result.result.results
-            error_info["operation_errors"] = []
-            for i, op_result in enumerate(op_results):
-                op_code = op_result.tr.type
-                error_info["operation_errors"].append({
+            error_info["operation_errors"] = [
+                {
                     "operation_index": i,
-                    "operation_type": str(op_code),
-                    "code": str(op_result.tr)
-                })
-        elif hasattr(result.result, 'code'):
+                    "operation_type": op_result.tr.type.name if op_result.tr else None,
+                    "code": _operation_result_code(op_result)
+                }
+                for i, op_result in enumerate(op_results)
+            ]
+        elif result_code is not None:
             # General transaction error
-            error_info["inner_code"] = str(result.result.code)
+            error_info["inner_code"] = str(result_code)
         
         return error_info
     except Exception as e:
         return {"error": f"Failed to decode error XDR: {str(e)}"}
 
+@functools.lru_cache(maxsize=4)
+def get_server(server_url="https://horizon-testnet.stellar.org"):
+    """
+    Return a Horizon Server shared per URL, backed by a pooled and retrying HTTP session.
+    
+    Args:
+        server_url (str): Horizon server URL
+        
+    Returns:
+        Server: The shared server
+    """
+    session = requests.Session()
+    # The identification headers the SDK would set on a session it built itself
+    session.headers.update({"X-Client-Name": "py-stellar-base", "X-Client-Version": stellar_sdk_version})
+    adapter = HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=32,
+        # Like the SDK's own session, hand back Horizon's final error response once retries run
+        # out so callers get a BadResponseError with its status and body, not a RetryError
+        max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=[429, 502, 503, 504], raise_on_status=False),
+    )
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return Server(server_url, client=RequestsClient(session=session))
+
+def _parse_balances(balance_entries):
+    """
+    Convert Horizon balance entries into the XLM balance, a per-asset dict and a balance index.
+    
+    Args:
+        balance_entries (list): The 'balances' list from a Horizon account response
+        
+    Returns:
+        tuple: (xlm_balance, balances, index) where index maps asset code to its exact Decimal balance
+    """
+    balances = {}
+    index = {}
+    xlm_balance = 0.0
+    
+    for balance_entry in balance_entries:
+        if balance_entry.get('asset_type') == "native":
+            index["XLM"] = Decimal(balance_entry.get('balance', 0))
+            xlm_balance = float(index["XLM"])
+            balances["XLM"] = {
+                "balance": xlm_balance,
+            }
+        else:
+            asset_code = balance_entry.get('asset_code', 'Unknown')
+            index[asset_code] = Decimal(balance_entry.get('balance', 0))
+            balances[asset_code] = {
+                "balance": float(balance_entry.get('balance', 0)),
+                "asset_type": balance_entry.get('asset_type')
+            }
+            # Include issuer if available
+            if 'asset_issuer' in balance_entry:
+                balances[asset_code]["issuer"] = balance_entry['asset_issuer']
+    
+    return xlm_balance, balances, index
+
 def check_account_balance(account_id, server_url="https://horizon-testnet.stellar.org"):
     """
     Check account balance and verify sufficient XLM for fees.
@@ -60,37 +145,23 @@ def check_account_balance(account_id, server_url="https://horizon-testnet.stella
         server_url (str): Horizon server URL
         
     Returns:
-        dict: Account balance information
+        dict: Either {"error": str}, or account_id, xlm_balance (float), sequence (int) and
+            balances, a dict keyed by asset code ("XLM" for native) whose values always
+            carry a float "balance", and _index, the same codes mapped to their exact
+            Decimal balance
     """
     try:
-        server = Server(server_url)
         # Use the accounts endpoint to get account data
-        account_data = server.accounts().account_id(account_id).call()
+        account_data = get_server(server_url).accounts().account_id(account_id).call()
         
-        balances = {}
-        xlm_balance = 0.0
-        
-        # Process balances from the account data
-        for balance_entry in account_data.get('balances', []):
-            if balance_entry.get('asset_type') == "native":
-                xlm_balance = float(balance_entry.get('balance', 0))
-                balances["XLM"] = {
-                    "balance": xlm_balance,
-                }
-            else:
-                asset_code = balance_entry.get('asset_code', 'Unknown')
-                balances[asset_code] = {
-                    "balance": float(balance_entry.get('balance', 0)),
-                    "asset_type": balance_entry.get('asset_type')
-                }
-                # Include issuer if available
-                if 'asset_issuer' in balance_entry:
-                    balances[asset_code]["issuer"] = balance_entry['asset_issuer']
+        # Sequence and balances both come from this single response
+        xlm_balance, balances, index = _parse_balances(account_data.get('balances', []))
         
         return {
             "account_id": account_id,
             "xlm_balance": xlm_balance,
             "balances": balances,
+            "_index": index,
             "sequence": int(account_data.get('sequence', 0))
         }
     except NotFoundError:
@@ -98,7 +169,29 @@ def check_account_balance(account_id, server_url="https://horizon-testnet.stella
     except Exception as e:
         return {"error": f"Failed to check account balance for {account_id}: {str(e)}"}
 
-def ensure_sufficient_fee(account_id, min_fee, server_url="https://horizon-testnet.stellar.org"):
+def batch_check_account_balances(account_ids, server_url="https://horizon-testnet.stellar.org", max_workers=8):
+    """
+    Check the balances of several accounts concurrently.
+    
+    Horizon has no multi-account lookup, so the per-account requests run in parallel.
+    
+    Args:
+        account_ids (list): Stellar account IDs
+        server_url (str): Horizon server URL
+        max_workers (int): Maximum number of concurrent requests
+        
+    Returns:
+        dict: Account ID -> check_account_balance() result for that account
+    """
+    unique_ids = list(dict.fromkeys(account_ids))
+    if not unique_ids:
+        return {}
+    
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(unique_ids))) as executor:
+        results = executor.map(lambda account_id: check_account_balance(account_id, server_url), unique_ids)
+        return dict(zip(unique_ids, results))
+
+def ensure_sufficient_fee(account_id, min_fee, server_url="https://horizon-testnet.stellar.org", balance_info=None):
     """
     Ensure the account has sufficient XLM for transaction fees.
     
@@ -106,11 +199,13 @@ def ensure_sufficient_fee(account_id, min_fee, server_url="https://horizon-testn
         account_id (str): Stellar account ID
         min_fee (int): Minimum required fee in stroops
         server_url (str): Horizon server URL
+        balance_info (dict): Result of a recent check_account_balance call, to skip fetching it again
         
     Returns:
         bool: True if sufficient funds, False otherwise
     """
-    balance_info = check_account_balance(account_id, server_url)
+    if balance_info is None:
+        balance_info = check_account_balance(account_id, server_url)
     if "error" in balance_info:
         print(f"Error checking balance: {balance_info['error']}")
         return False
@@ -1,10 +1,7 @@
 import os
 import time
-from dotenv import load_dotenv
-from stellar_sdk import Server, TransactionBuilder, LiquidityPoolAsset, Network, Asset
-
-# Load environment variables
-load_dotenv()
+import config  # Loads .env once per process
+from stellar_sdk import Account, Server, TransactionBuilder, LiquidityPoolAsset, Network, Asset
 
 def setup_liquidity_pools(accounts: list, assets: list):
     """
@@ -33,12 +30,12 @@ def setup_liquidity_pools(accounts: list, assets: list):
     pool_asset = LiquidityPoolAsset(asset_a, asset_b)
 
     try:
-        # Load the account to check balances
-        source_account = server.load_account(liquidity_provider.public_key)
+        # Load the account once; the response carries both sequence and balances
+        account_data = server.accounts().account_id(liquidity_provider.public_key).call()
+        source_account = Account(liquidity_provider.public_key, int(account_data['sequence']))
         print(f"Liquidity provider account loaded: {liquidity_provider.public_key}")
         
         # Check if the liquidity provider has sufficient balances
-        account_data = server.accounts().account_id(liquidity_provider.public_key).call()
         btc_balance = 0
         usdc_balance = 0
         
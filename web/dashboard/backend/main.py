@@ -1,108 +1,288 @@
 import asyncio
+import errno
 import websockets
 import subprocess
 import os
-import json
+import socket
+import orjson
+import logging
+import queue
 import sys
+import time
 import traceback
+from logging.handlers import QueueHandler, QueueListener
 from contract_client import ContractClient
 from trading_account import load_trading_account
 
 # Add the current directory to the Python path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
+logger = logging.getLogger("engine")
+
+def _dumps(obj):
+    """
+    Serialize obj to a JSON string with orjson.
+    
+    The result is decoded to str so websockets sends a text frame, which the
+    dashboard parses with JSON.parse.
+    """
+    return orjson.dumps(obj, default=lambda o: o.__dict__ if hasattr(o, '__dict__') else str(o)).decode()
+
+def _frame(key, value):
+    """
+    Build the {key: value} frame by splicing the encoded value into a fixed
+    envelope, so the wrapper dict is never allocated or encoded.
+    
+    key must be a plain literal that needs no JSON escaping.
+    """
+    return '{"' + key + '":' + _dumps(value) + '}'
+
+def configure_logging(level=logging.INFO):
+    """
+    Route log records through a queue so the stdout writes happen on a
+    background thread instead of blocking the event loop.
+    
+    Returns:
+        QueueListener: The started listener; call stop() on shutdown to flush it
+    """
+    log_queue = queue.SimpleQueue()
+    logging.basicConfig(level=level, handlers=[QueueHandler(log_queue)])
+    listener = QueueListener(log_queue, logging.StreamHandler(sys.stdout))
+    listener.start()
+    return listener
+
+# uvloop provides a faster event loop where it is supported
+uvloop = None
+if sys.platform != "win32":
+    try:
+        import uvloop
+    except ImportError:
+        pass
+
+# Import the engine once at startup rather than on every start_engine command
+try:
+    from arbitrage_engine import run_arbitrage_engine
+except ImportError as e:
+    logger.warning("Arbitrage engine unavailable: %s", e)
+    run_arbitrage_engine = None
+
+# Seconds to reuse the contract's supported asset list before querying it again
+SUPPORTED_ASSETS_TTL = 60
+
+_CONTRACT_CLIENT = None
+_TRADER = None
+_SUPPORTED_ASSETS_CACHE = (0.0, None)
+
+def _get_contract_client():
+    """Return the shared ContractClient, reconnecting if the last attempt had no Soroban server."""
+    global _CONTRACT_CLIENT
+    if _CONTRACT_CLIENT is None or not _CONTRACT_CLIENT.server:
+        _CONTRACT_CLIENT = ContractClient()
+    return _CONTRACT_CLIENT
+
+def _get_trader():
+    """Return the trading account keypair, loading it from disk on first use."""
+    global _TRADER
+    if _TRADER is None:
+        _TRADER = load_trading_account()
+    return _TRADER
+
+def _reload_trader():
+    """Drop the cached trading account and load it again from disk."""
+    global _TRADER
+    _TRADER = None
+    return _get_trader()
+
+def _get_supported_assets(contract_client, trader_keypair):
+    """Return the contract's supported assets, cached for SUPPORTED_ASSETS_TTL seconds."""
+    global _SUPPORTED_ASSETS_CACHE
+    fetched_at, assets = _SUPPORTED_ASSETS_CACHE
+    if assets is not None and time.monotonic() - fetched_at < SUPPORTED_ASSETS_TTL:
+        return assets
+    
+    assets = contract_client.get_supported_assets(trader_keypair)
+    # Only cache successful lookups so a transient failure is retried on the next request
+    if assets:
+        _SUPPORTED_ASSETS_CACHE = (time.monotonic(), assets)
+    return assets
+
+# Maximum number of engine messages buffered ahead of the websocket
+ENGINE_QUEUE_SIZE = 256
+
+async def _pump_engine(trader_keypair, engine_queue):
+    """
+    Feed run_arbitrage_engine output into engine_queue.
+    
+    The stream ends with None, preceded by the exception if the engine failed.
+    """
+    try:
+        async for message in run_arbitrage_engine(accounts=[trader_keypair]):
+            await engine_queue.put(message)
+    except Exception as e:
+        await engine_queue.put(e)
+    await engine_queue.put(None)
+
 # Function to run the arbitrage engine and stream its output
 async def run_engine(websocket):
     try:
-        # Import the run_arbitrage_engine function directly
-        from arbitrage_engine import run_arbitrage_engine
+        if run_arbitrage_engine is None:
+            await websocket.send(_frame("error", "engine module unavailable"))
+            return
         
         # Load trading account
-        trader_keypair = load_trading_account()
+        trader_keypair = _get_trader()
         if not trader_keypair:
-            await websocket.send(json.dumps({"error": "No trading account available"}))
+            await websocket.send(_frame("error", "No trading account available"))
             return
             
-        # Run the arbitrage engine and stream output
-        async for message in run_arbitrage_engine(accounts=[trader_keypair]):
-            print(f"Sending: {message}")
-            await websocket.send(json.dumps({"log": message}))
-            await asyncio.sleep(0.1)  # Small delay to prevent overwhelming the connection
+        # Run the arbitrage engine in its own task so a slow client does not stall it
+        engine_queue = asyncio.Queue(maxsize=ENGINE_QUEUE_SIZE)
+        producer = asyncio.create_task(_pump_engine(trader_keypair, engine_queue))
+        try:
+            while (message := await engine_queue.get()) is not None:
+                if isinstance(message, Exception):
+                    raise message
+                logger.debug("Sending: %s", message)
+                # send() waits for the write buffer to drain, so a slow client applies back-pressure
+                await websocket.send(_frame("log", message))
+        finally:
+            producer.cancel()
             
+    except websockets.exceptions.ConnectionClosed:
+        # Stop streaming to a client that has gone away instead of retrying sends on a dead socket
+        logger.info("Client disconnected, stopping engine stream")
     except Exception as e:
         error_msg = f"ERROR in run_engine: {str(e)}\n{traceback.format_exc()}"
-        print(error_msg)
-        await websocket.send(json.dumps({"error": error_msg}))
+        logger.error(error_msg)
+        await websocket.send(_frame("error", error_msg))
+
+async def _cmd_get_supported_assets(websocket, data):
+    contract_client = _get_contract_client()
+    trader_keypair = _get_trader()
+    if trader_keypair:
+        # Check if we have a connection to the Soroban server
+        if not contract_client.server:
+            await websocket.send(_frame("error", "No connection to Soroban RPC server"))
+        else:
+            assets = _get_supported_assets(contract_client, trader_keypair)
+            await websocket.send(_frame("supported_assets", assets))
+    else:
+        await websocket.send(_frame("error", "No trading account available"))
+
+async def _cmd_start_engine(websocket, data):
+    # Run the engine in a separate task to avoid blocking
+    asyncio.create_task(run_engine(websocket))
+
+async def _cmd_reload_trading_account(websocket, data):
+    # Pick up a rotated trading account without restarting the server
+    trader_keypair = _reload_trader()
+    if trader_keypair:
+        await websocket.send(_frame("trading_account", trader_keypair.public_key))
+    else:
+        await websocket.send(_frame("error", "No trading account available"))
+
+# WebSocket command name -> handler coroutine
+COMMANDS = {
+    'get_supported_assets': _cmd_get_supported_assets,
+    'start_engine': _cmd_start_engine,
+    'reload_trading_account': _cmd_reload_trading_account,
+}
 
 # WebSocket handler
 async def handler(websocket):
-    print("Client connected")
+    logger.info("Client connected")
     try:
         async for message in websocket:
             try:
-                data = json.loads(message)
-                if data.get('command') == 'get_supported_assets':
-                    contract_client = ContractClient()
-                    trader_keypair = load_trading_account()
-                    if trader_keypair:
-                        # Check if we have a connection to the Soroban server
-                        if not contract_client.server:
-                            await websocket.send(json.dumps({"error": "No connection to Soroban RPC server"}))
-                        else:
-                            assets = contract_client.get_supported_assets(trader_keypair)
-                            await websocket.send(json.dumps({"supported_assets": assets}))
-                    else:
-                        await websocket.send(json.dumps({"error": "No trading account available"}))
-                elif data.get('command') == 'start_engine':
-                    # Run the engine in a separate task to avoid blocking
-                    asyncio.create_task(run_engine(websocket))
-            except json.JSONDecodeError:
-                print(f"Received non-JSON message: {message}")
-                await websocket.send(json.dumps({"log": f"Received non-JSON message: {message}"}))
+                data = orjson.loads(message)
+                command = COMMANDS.get(data.get('command'))
+                if command:
+                    await command(websocket, data)
+            except orjson.JSONDecodeError:
+                logger.info("Received non-JSON message: %s", message)
+                await websocket.send(_frame("log", f"Received non-JSON message: {message}"))
 
     except websockets.exceptions.ConnectionClosed:
-        print("Client disconnected")
+        logger.info("Client disconnected")
     except Exception as e:
-        print(f"Error in WebSocket handler: {e}")
-        traceback.print_exc()
+        logger.exception("Error in WebSocket handler: %s", e)
     finally:
-        print("Connection closed")
+        logger.info("Connection closed")
+
+# errno values for "address already in use" on POSIX and Windows (WSAEADDRINUSE)
+ADDRESS_IN_USE_ERRNOS = {errno.EADDRINUSE, getattr(errno, "WSAEADDRINUSE", 10048)}
+
+def bind_server_socket(host, ports_to_try):
+    """Bind a listening socket to the first free port in ports_to_try, or return None."""
+    # Resolve host once to pick the address family, so IPv6 hosts such as "::1" work too
+    try:
+        family = socket.getaddrinfo(host, ports_to_try[0], type=socket.SOCK_STREAM)[0][0]
+    except socket.gaierror as e:
+        logger.error("Failed to resolve WebSocket server host %s: %s", host, e)
+        return None
+    
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    if os.name != "nt":
+        # Allow a quick restart while the previous server's socket is in TIME_WAIT.
+        # SO_REUSEPORT is deliberately not set: it would let two live servers share a port.
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    
+    for try_port in ports_to_try:
+        try:
+            # The resolved address for this family already has the family's tuple shape
+            sockaddr = socket.getaddrinfo(host, try_port, family, socket.SOCK_STREAM)[0][4]
+            sock.bind(sockaddr)
+            return sock
+        except OSError as e:
+            if e.errno in ADDRESS_IN_USE_ERRNOS:
+                logger.info("Port %s is already in use, trying next port...", try_port)
+                continue
+            logger.error("Failed to bind WebSocket server to port %s: %s", try_port, e)
+            break
+    
+    sock.close()
+    return None
 
 # Start the WebSocket server
 async def main():
     # Get the port from environment variables, default to 8768 as per project specification
     port = int(os.environ.get("PORT", 8768))
-    print(f"Starting WebSocket server on port {port}...")
+    logger.info("Starting WebSocket server on port %s...", port)
     
     # Try alternative ports if the default is in use
     ports_to_try = [port, 8769, 8770, 8771]
     
-    for try_port in ports_to_try:
-        try:
-            async with websockets.serve(handler, "localhost", try_port) as server:
-                print(f"WebSocket server started on ws://localhost:{try_port}")
-                await asyncio.Future()  # run forever
-                break  # If successful, break out of the loop
-        except OSError as e:
-            if "10048" in str(e) or "Address already in use" in str(e):
-                print(f"Port {try_port} is already in use, trying next port...")
-                continue
-            else:
-                print(f"Failed to start WebSocket server on port {try_port}: {e}")
-                traceback.print_exc()
-                break
-        except Exception as e:
-            print(f"Failed to start WebSocket server on port {try_port}: {e}")
-            traceback.print_exc()
-            break
-    else:
-        print("Failed to start WebSocket server on any of the attempted ports")
+    sock = bind_server_socket("localhost", ports_to_try)
+    if sock is None:
+        logger.error("Failed to start WebSocket server on any of the attempted ports")
+        return
+    
+    bound_port = sock.getsockname()[1]
+    try:
+        # Compression only costs CPU on a localhost socket; the larger limits absorb bursty sends
+        async with websockets.serve(
+            handler,
+            sock=sock,
+            max_size=2**22,
+            write_limit=2**20,
+            compression=None,
+            ping_interval=20,
+            ping_timeout=20,
+        ) as server:
+            logger.info("WebSocket server started on ws://localhost:%s", bound_port)
+            await asyncio.Future()  # run forever
+    except Exception as e:
+        logger.exception("Failed to start WebSocket server on port %s: %s", bound_port, e)
 
 if __name__ == "__main__":
+    log_listener = configure_logging()
+    if uvloop is not None:
+        uvloop.install()
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
-        print("Server stopped by user")
+        logger.info("Server stopped by user")
     except Exception as e:
-        print(f"Server error: {e}")
-        traceback.print_exc()
\ No newline at end of file
+        logger.exception("Server error: %s", e)
+    finally:
+        log_listener.stop()
\ No newline at end of file
@@ -1,19 +1,16 @@
 import os
 import time
-from dotenv import load_dotenv
-from stellar_sdk import Server, TransactionBuilder, Network, Asset
+import config  # Loads .env once per process
+from stellar_sdk import Account, Server, TransactionBuilder, Network, Asset
 
-# Load environment variables
-load_dotenv()
+HORIZON_URL = os.getenv('STELLAR_HORIZON_URL', 'https://horizon-testnet.stellar.org')
+NETWORK_PASSPHRASE = os.getenv('STELLAR_NETWORK_PASSPHRASE', 'Test SDF Network ; September 2015')
 
 def create_market_orders(accounts: list, assets: list):
     """
     Creates initial market orders on the SDEX.
     """
-    horizon_url = os.getenv('STELLAR_HORIZON_URL', 'https://horizon-testnet.stellar.org')
-    network_passphrase = os.getenv('STELLAR_NETWORK_PASSPHRASE', 'Test SDF Network ; September 2015')
-    
-    server = Server(horizon_url)
+    server = Server(HORIZON_URL)
     
     if len(accounts) < 3:
         print("Not enough accounts to create market orders")
@@ -26,18 +23,21 @@ def create_market_orders(accounts: list, assets: list):
     print(f"Creating market order for {trader.public_key}")
 
     try:
-        # Load trader account
-        source_account = server.load_account(trader.public_key)
+        # Load trader account; one /accounts/{id} response carries both sequence and balances
+        account_data = server.accounts().account_id(trader.public_key).call()
+        source_account = Account(trader.public_key, int(account_data['sequence']))
         print(f"Trader account loaded: {trader.public_key}")
         
         # Check trader's asset balances
-        account_data = server.accounts().account_id(trader.public_key).call()
-        btc_balance = 0
-        
-        for balance in account_data['balances']:
-            if balance['asset_type'] != 'native':
-                if balance.get('asset_code') == selling_asset.code and balance.get('asset_issuer') == selling_asset.issuer:
-                    btc_balance = float(balance['balance'])
+        balances = account_data['balances']
+        btc_balance = float(next(
+            (
+                balance['balance'] for balance in balances
+                if balance.get('asset_code') == selling_asset.code
+                and balance.get('asset_issuer') == selling_asset.issuer
+            ),
+            0
+        ))
         
         print(f"Trader {selling_asset.code} balance: {btc_balance}")
         
@@ -48,7 +48,7 @@ def create_market_orders(accounts: list, assets: list):
 
         builder = TransactionBuilder(
             source_account=source_account,
-            network_passphrase=network_passphrase,
+            network_passphrase=NETWORK_PASSPHRASE,
             base_fee=100,
         ).set_timeout(30)
         
@@ -0,0 +1,51 @@
+"""
+Token-bucket rate limiting for calls to Horizon and Friendbot
+"""
+
+import asyncio
+import threading
+import time
+
+class TokenBucket:
+    """Allow `rate` calls per second on average, with bursts of up to `burst` calls."""
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.capacity = burst
+        self.tokens = float(burst)
+        self.last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Take one token, going into debt if none are left, and return the seconds to wait for it."""
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.rate)
+        self.last = now
+        self.tokens -= 1
+        return -self.tokens / self.rate if self.tokens < 0 else 0.0
+
+    def acquire(self):
+        """Block until a token is available."""
+        with self._lock:
+            wait = self._reserve()
+        if wait:
+            time.sleep(wait)
+
+class AsyncTokenBucket:
+    """Coroutine view of a TokenBucket; takes its tokens but waits with asyncio.sleep instead of blocking the loop."""
+
+    def __init__(self, bucket: TokenBucket):
+        self.bucket = bucket
+
+    async def acquire(self):
+        """Wait until a token is available."""
+        # Nothing awaits while the lock is held, so sharing it with threads is safe
+        with self.bucket._lock:
+            wait = self.bucket._reserve()
+        if wait:
+            await asyncio.sleep(wait)
+
+# Shared limit for every Horizon submission, account load and Friendbot request,
+# whether made from threads or coroutines
+HORIZON_BUCKET = TokenBucket(rate=3.0, burst=10)
+HORIZON_ASYNC_BUCKET = AsyncTokenBucket(HORIZON_BUCKET)
@@ -1,12 +1,20 @@
 import os
 import json
+import asyncio
+import aiohttp
+import orjson
 import requests
 import time
-from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from collections import OrderedDict
+import config  # Loads .env once per process
 from stellar_sdk import Asset
 
-# Load environment variables
-load_dotenv()
+# Seconds a fetched price is reused before querying the oracle again
+PRICE_CACHE_TTL = 0.5
+# Maximum number of (asset, exchange) prices kept in the cache
+PRICE_CACHE_MAX_SIZE = 1000
 
 class ReflectorOracleClient:
     def __init__(self):
@@ -17,6 +25,63 @@ class ReflectorOracleClient:
         # Validate configuration
         if not self.api_url or not self.api_key:
             raise ValueError("REFLECTOR_API_URL and REFLECTOR_API_KEY must be set in .env")
+        
+        # Request headers and per-pair URLs are built once and reused on every poll
+        self._headers = {
+            'Authorization': f'Bearer {self.api_key}',
+            'Content-Type': 'application/json'
+        }
+        self._url_cache = {}
+        
+        # (asset_code, exchange) -> (fetched_at, price data), least recently used first
+        self._price_cache = OrderedDict()
+        
+        # Keep-alive session so repeated price polls reuse the same connection
+        self.session = requests.Session()
+        self.session.headers.update(self._headers)
+        self.session.mount('https://', HTTPAdapter(
+            pool_connections=8,
+            pool_maxsize=32,
+            max_retries=Retry(total=2, backoff_factor=0.1),
+        ))
+        
+        # aiohttp session for the async polls and the event loop it belongs to, created on first use
+        self._async_session = None
+        self._async_session_loop = None
+
+    def _price_url(self, key: tuple) -> str:
+        """Return the oracle price URL for an (asset_code, exchange) key."""
+        url = self._url_cache.get(key)
+        if url is None:
+            asset_code, exchange = key
+            url = self._url_cache[key] = f"{self.api_url}/price/{asset_code}/{exchange}"
+        return url
+
+    def _get_cached_price(self, key: tuple) -> dict:
+        """Return the cached price for key if it is still fresh, otherwise None."""
+        cached = self._price_cache.get(key)
+        if cached and time.monotonic() - cached[0] < PRICE_CACHE_TTL:
+            self._price_cache.move_to_end(key)
+            return cached[1]
+        return None
+
+    def _store_price(self, key: tuple, data: dict) -> dict:
+        """Build the price result from an oracle response and cache it under key."""
+        asset_code, exchange = key
+        result = {
+            'asset': asset_code,
+            'price': data.get('price'),
+            'volume_24h': data.get('volume_24h', 0),
+            'timestamp': int(time.time()),
+            'source': exchange,
+            'confidence': data.get('confidence', 90)
+        }
+        
+        self._price_cache[key] = (time.monotonic(), result)
+        self._price_cache.move_to_end(key)
+        if len(self._price_cache) > PRICE_CACHE_MAX_SIZE:
+            self._price_cache.popitem(last=False)
+        return result
 
     def get_asset_price(self, asset_code: str, exchange: str = "Stellar DEX") -> dict:
         """
@@ -29,25 +94,17 @@ class ReflectorOracleClient:
         Returns:
             Dictionary with price data or None if error
         """
+        key = (asset_code, exchange)
+        cached = self._get_cached_price(key)
+        if cached:
+            return cached
+        
         try:
-            url = f"{self.api_url}/price/{asset_code}/{exchange}"
-            headers = {
-                'Authorization': f'Bearer {self.api_key}',
-                'Content-Type': 'application/json'
-            }
-            
-            response = requests.get(url, headers=headers, timeout=10)
+            response = self.session.get(self._price_url(key), timeout=10)
             response.raise_for_status()
             
-            data = response.json()
-            return {
-                'asset': asset_code,
-                'price': data.get('price'),
-                'volume_24h': data.get('volume_24h', 0),
-                'timestamp': int(time.time()),
-                'source': exchange,
-                'confidence': data.get('confidence', 90)
-            }
+            data = orjson.loads(response.content)
+            return self._store_price(key, data)
             
         except requests.exceptions.RequestException as e:
             print(f"Error fetching price for {asset_code} from {exchange}: {e}")
@@ -73,6 +130,93 @@ class ReflectorOracleClient:
                 prices[f"{asset_code}-{exchange}"] = price_data
         return prices
 
+    def get_multiple_asset_prices_concurrent(self, asset_pairs: list) -> dict:
+        """
+        Fetch prices for multiple asset pairs concurrently from synchronous code.
+        
+        Runs get_multiple_asset_prices_async in its own event loop, so it must not be
+        called from inside a running loop; await get_multiple_asset_prices_async there.
+        
+        Args:
+            asset_pairs: List of tuples (asset_code, exchange)
+            
+        Returns:
+            Dictionary mapping asset pairs to price data
+        """
+        async def fetch():
+            try:
+                return await self.get_multiple_asset_prices_async(asset_pairs)
+            finally:
+                # The session cannot outlive this loop
+                await self.close()
+        
+        return asyncio.run(fetch())
+
+    def _get_async_session(self) -> aiohttp.ClientSession:
+        """Return the keep-alive aiohttp session for the running loop, creating it if needed."""
+        loop = asyncio.get_running_loop()
+        # A session only works on the loop that created it, e.g. not across asyncio.run() calls
+        if self._async_session is None or self._async_session.closed or self._async_session_loop is not loop:
+            self._async_session_loop = loop
+            self._async_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=32, ttl_dns_cache=300),
+                timeout=aiohttp.ClientTimeout(total=10),
+                headers=self._headers,
+            )
+        return self._async_session
+
+    async def close(self):
+        """Close the aiohttp session used by get_multiple_asset_prices_async."""
+        if self._async_session is not None:
+            await self._async_session.close()
+            self._async_session = None
+            self._async_session_loop = None
+
+    async def _fetch_asset_price(self, session: aiohttp.ClientSession, asset_code: str, exchange: str) -> dict:
+        """Async counterpart of get_asset_price that issues the request on session."""
+        key = (asset_code, exchange)
+        cached = self._get_cached_price(key)
+        if cached:
+            return cached
+        
+        try:
+            async with session.get(self._price_url(key)) as response:
+                response.raise_for_status()
+                data = orjson.loads(await response.read())
+            return self._store_price(key, data)
+            
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            print(f"Error fetching price for {asset_code} from {exchange}: {e}")
+            return None
+        except json.JSONDecodeError as e:
+            print(f"Error parsing response for {asset_code} from {exchange}: {e}")
+            return None
+
+    async def get_multiple_asset_prices_async(self, asset_pairs: list) -> dict:
+        """
+        Fetch prices for multiple asset pairs concurrently.
+        
+        Args:
+            asset_pairs: List of tuples (asset_code, exchange)
+            
+        Returns:
+            Dictionary mapping asset pairs to price data
+        """
+        session = self._get_async_session()
+        # One pair failing unexpectedly must not discard the prices fetched for the others
+        results = await asyncio.gather(*(
+            self._fetch_asset_price(session, asset_code, exchange)
+            for asset_code, exchange in asset_pairs
+        ), return_exceptions=True)
+        
+        prices = {}
+        for (asset_code, exchange), price_data in zip(asset_pairs, results):
+            if isinstance(price_data, Exception):
+                print(f"Error fetching price for {asset_code} from {exchange}: {price_data}")
+            elif price_data:
+                prices[f"{asset_code}-{exchange}"] = price_data
+        return prices
+
     def validate_price_data(self, price_data: dict, historical_data: dict = None) -> bool:
         """
         Validate price data for manipulation detection.
@@ -86,14 +230,18 @@ class ReflectorOracleClient:
         """
         if not price_data:
             return False
+        
+        confidence = price_data.get('confidence', 0)
+        timestamp = price_data.get('timestamp', 0)
+        now = time.time()
             
         # Check confidence score
-        if price_data.get('confidence', 0) < 80:
-            print(f"Low confidence score: {price_data.get('confidence')}")
+        if confidence < 80:
+            print(f"Low confidence score: {confidence}")
             return False
             
         # Check data freshness (within 60 seconds)
-        if time.time() - price_data.get('timestamp', 0) > 60:
+        if now - timestamp > 60:
             print("Stale price data")
             return False
             
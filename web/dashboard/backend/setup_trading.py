@@ -3,6 +3,7 @@
 Setup script to create and fund a trading account
 """
 
+import config  # Loads .env once per process
 from trading_account import setup_trading_account, load_trading_account, ensure_sufficient_xlm
 from accounts import load_keypairs
 
@@ -39,4 +40,5 @@ def main():
                 print("✗ Failed to ensure sufficient XLM")
 
 if __name__ == "__main__":
+    config.configure_script_logging()
     main()
\ No newline at end of file
@@ -5,42 +5,97 @@ Script to establish trustlines and distribute assets to the trading account
 
 import os
 import sys
+import logging
 sys.path.append(os.path.join(os.path.dirname(__file__)))
 
-from dotenv import load_dotenv
+import config  # Loads .env once per process
 from stellar_sdk import Keypair, Asset
 from trading_account import load_trading_account
 from assets import create_assets_and_trustlines
-import json
+import orjson
+import pickle
+import mmap
+import functools
+from concurrent.futures import ProcessPoolExecutor
 
-# Load environment variables
-load_dotenv()
+logger = logging.getLogger("trading")
+
+KEYPAIRS_FILE = os.path.join("data", "keypairs.json")
+# Pickled Keypair objects, rebuilt whenever keypairs.json changes
+KEYPAIRS_CACHE_FILE = os.path.join("data", "keypairs.cache.pkl")
+# Below this many secrets, process start-up costs more than the key derivation
+PARALLEL_KEYPAIR_THRESHOLD = 32
+# Keypair files at least this large are parsed straight from a memory map
+MMAP_THRESHOLD = 1 << 20
+
+@functools.lru_cache(maxsize=4096)
+def _keypair_from_secret(secret: str) -> Keypair:
+    """Memoized Keypair.from_secret for callers that derive the same secret repeatedly."""
+    return Keypair.from_secret(secret)
+
+def _keypairs_from_secrets(secrets: list) -> list:
+    """Derive keypairs, spreading large batches across a process pool."""
+    if len(secrets) < PARALLEL_KEYPAIR_THRESHOLD:
+        return [_keypair_from_secret(secret) for secret in secrets]
+    
+    workers = os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(Keypair.from_secret, secrets, chunksize=max(1, len(secrets) // (4 * workers))))
+
+def _load_cached_keypairs(mtime: float) -> list:
+    """Return the cached keypairs if they were built from the current keypairs file."""
+    try:
+        with open(KEYPAIRS_CACHE_FILE, 'rb') as f:
+            cached_mtime, keypairs = pickle.load(f)
+    except Exception:
+        return None
+    return keypairs if cached_mtime == mtime else None
+
+def _save_cached_keypairs(mtime: float, keypairs: list):
+    """Atomically write the keypair cache for the given keypairs file mtime."""
+    tmp_file = KEYPAIRS_CACHE_FILE + ".tmp"
+    try:
+        with open(tmp_file, 'wb') as f:
+            pickle.dump((mtime, keypairs), f)
+        os.replace(tmp_file, KEYPAIRS_CACHE_FILE)
+    except Exception as e:
+        logger.warning("Could not write keypair cache: %s", e)
 
 def load_existing_accounts():
     """Load existing accounts from keypairs file."""
-    KEYPAIRS_FILE = os.path.join("data", "keypairs.json")
-    
     if not os.path.exists(KEYPAIRS_FILE):
         return []
     
     try:
-        with open(KEYPAIRS_FILE, 'r') as f:
-            data = json.load(f)
-            return [Keypair.from_secret(item['secret']) for item in data]
+        mtime = os.path.getmtime(KEYPAIRS_FILE)
+        keypairs = _load_cached_keypairs(mtime)
+        if keypairs is not None:
+            return keypairs
+        
+        with open(KEYPAIRS_FILE, 'rb') as f:
+            if os.fstat(f.fileno()).st_size >= MMAP_THRESHOLD:
+                # Parse the mapped pages directly instead of copying the file into a bytes object
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                    data = orjson.loads(view)
+            else:
+                data = orjson.loads(f.read())
+        keypairs = _keypairs_from_secrets([item['secret'] for item in data])
+        _save_cached_keypairs(mtime, keypairs)
+        return keypairs
     except Exception as e:
-        print(f"Error loading existing accounts: {e}")
+        logger.error("Error loading existing accounts: %s", e)
         return []
 
 def main():
-    print("Setting up assets for trading account...")
+    logger.info("Setting up assets for trading account...")
     
     # Load trading account
     trading_account = load_trading_account()
     if not trading_account:
-        print("No trading account found. Please run trading_account.py first.")
+        logger.error("No trading account found. Please run trading_account.py first.")
         return
     
-    print(f"Trading account: {trading_account.public_key}")
+    logger.info("Trading account: %s", trading_account.public_key)
     
     # Load existing accounts (we'll include the trading account in the list for trustline establishment)
     accounts = load_existing_accounts()
@@ -52,8 +107,9 @@ def main():
     # This function establishes trustlines for all real assets for all accounts
     real_assets = create_assets_and_trustlines(accounts)
     
-    print("Asset setup for trading account complete!")
-    print("Note: Real assets are already issued on the network, no distribution needed.")
+    logger.info("Asset setup for trading account complete!")
+    logger.info("Note: Real assets are already issued on the network, no distribution needed.")
 
 if __name__ == "__main__":
+    config.configure_script_logging()
     main()
\ No newline at end of file
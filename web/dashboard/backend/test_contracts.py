@@ -5,67 +5,77 @@ Test script to verify contract interactions
 
 import asyncio
 import json
+import logging
+import config  # Loads .env once per process
 from contract_client import ContractClient
-from trading_account import load_trading_account, ensure_sufficient_xlm
+from stellar_sdk.xdr import SCValType
+from trading_account import load_trading_account, ensure_sufficient_xlm_async
+
+logger = logging.getLogger("tests")
 
 async def test_contract_interactions():
-    print("Testing contract interactions...")
+    logger.info("Testing contract interactions...")
     
     # Initialize contract client
     contract_client = ContractClient()
     
     # Check if we have a connection to the Soroban server
     if not contract_client.server:
-        print("ERROR: No connection to Soroban RPC server. Cannot interact with smart contracts.")
-        print("Please check your network connection and RPC server availability.")
+        logger.error("ERROR: No connection to Soroban RPC server. Cannot interact with smart contracts.")
+        logger.error("Please check your network connection and RPC server availability.")
         return
     
     # Load trading account
     trader_keypair = load_trading_account()
     if not trader_keypair:
-        print("No trading account available. Please create one first.")
+        logger.error("No trading account available. Please create one first.")
         return
     
-    print(f"Using trader account: {trader_keypair.public_key}")
+    logger.info("Using trader account: %s", trader_keypair.public_key)
     
     # Ensure the trading account has sufficient XLM
-    if not ensure_sufficient_xlm(trader_keypair.public_key, 10.0):
-        print("Failed to ensure sufficient XLM for trading account")
+    if not await ensure_sufficient_xlm_async(trader_keypair.public_key, 10.0):
+        logger.error("Failed to ensure sufficient XLM for trading account")
         return
     
     # Test 1: Set reflector contract ID
-    print("\n1. Testing set_reflector_contract_id...")
+    logger.info("\n1. Testing set_reflector_contract_id...")
     if contract_client.oracle_contract_id:
         result, error = contract_client.set_reflector_contract_id(
             trader_keypair, 
             contract_client.oracle_contract_id
         )
         if result:
-            print("✓ Successfully set reflector contract ID")
+            logger.info("✓ Successfully set reflector contract ID")
         else:
-            print(f"✗ Failed to set reflector contract ID: {error}")
+            logger.error("✗ Failed to set reflector contract ID: %s", error)
     else:
-        print("✗ REFLECTOR_ORACLE_CONTRACT_ID not set in environment variables")
+        logger.error("✗ REFLECTOR_ORACLE_CONTRACT_ID not set in environment variables")
+    
+    # Tests 2 and 3 only simulate, so run them as one batch
+    logger.info("\n2. Testing get_supported_assets...")
+    logger.info("\n3. Testing is_asset_supported...")
+    test_asset = "AQUA"  # Common asset on Stellar testnet
+    loop = asyncio.get_running_loop()
+    assets_scval, supported_scval = await loop.run_in_executor(None, contract_client.simulate_batch, trader_keypair, [
+        ("get_supported_assets", []),
+        ("is_asset_supported", [contract_client._create_string_scval(test_asset)]),
+    ])
+    supported_assets = contract_client._parse_supported_assets(assets_scval) if assets_scval else []
+    is_supported = bool(supported_scval and supported_scval.type == SCValType.SCV_BOOL and supported_scval.b)
     
-    # Test 2: Get supported assets
-    print("\n2. Testing get_supported_assets...")
-    supported_assets = contract_client.get_supported_assets(trader_keypair)
     if supported_assets:
-        print(f"✓ Successfully retrieved supported assets: {supported_assets}")
+        logger.info("✓ Successfully retrieved supported assets: %s", supported_assets)
     else:
-        print("✗ Failed to retrieve supported assets")
+        logger.error("✗ Failed to retrieve supported assets")
     
-    # Test 3: Check if specific asset is supported
-    print("\n3. Testing is_asset_supported...")
-    test_asset = "AQUA"  # Common asset on Stellar testnet
-    is_supported = contract_client.is_asset_supported(trader_keypair, test_asset)
     if is_supported:
-        print(f"✓ Asset {test_asset} is supported")
+        logger.info("✓ Asset %s is supported", test_asset)
     else:
-        print(f"✗ Asset {test_asset} is not supported or check failed")
+        logger.error("✗ Asset %s is not supported or check failed", test_asset)
     
     # Test 4: Scan arbitrage opportunities
-    print("\n4. Testing scan_arbitrage_opportunities...")
+    logger.info("\n4. Testing scan_arbitrage_opportunities...")
     # Use a small list of assets for testing
     test_assets = [test_asset] if is_supported else None
     result, error = contract_client.scan_opportunities(
@@ -74,9 +84,10 @@ async def test_contract_interactions():
         min_profit=1000000  # Small minimum profit for testing
     )
     if result:
-        print("✓ Successfully scanned for arbitrage opportunities")
+        logger.info("✓ Successfully scanned for arbitrage opportunities")
     else:
-        print(f"✗ Failed to scan for arbitrage opportunities: {error}")
+        logger.error("✗ Failed to scan for arbitrage opportunities: %s", error)
 
 if __name__ == "__main__":
+    config.configure_script_logging()
     asyncio.run(test_contract_interactions())
\ No newline at end of file
@@ -4,50 +4,71 @@ Test script to verify WebSocket connection
 """
 
 import asyncio
+import sys
+import logging
+import config  # Loads .env once per process
 import websockets
 import json
 
-async def test_websocket():
-    uri = "ws://localhost:8768"
+URI = "ws://localhost:8768"
+
+logger = logging.getLogger("tests")
+
+async def run_probes(websocket):
+    """Send the dashboard commands over an open connection and print what comes back."""
+    # Read in the background so both commands can be in flight at once
+    queue = asyncio.Queue()
+    
+    async def reader():
+        async for message in websocket:
+            await queue.put(message)
+    
+    reader_task = asyncio.create_task(reader())
+    
+    await websocket.send(json.dumps({"command": "get_supported_assets"}))
+    logger.info("Sent get_supported_assets command")
+    await websocket.send(json.dumps({"command": "start_engine"}))
+    logger.info("Sent start_engine command")
+    
+    # Wait for the supported assets response plus a few engine messages
     try:
-        async with websockets.connect(uri) as websocket:
-            print(f"Connected to {uri}")
-            
-            # Send request for supported assets
-            await websocket.send(json.dumps({"command": "get_supported_assets"}))
-            print("Sent get_supported_assets command")
-            
-            # Wait for response
-            response = await websocket.recv()
-            print(f"Received: {response}")
+        for i in range(6):
+            try:
+                response = await asyncio.wait_for(queue.get(), timeout=10.0)
+            except asyncio.TimeoutError:
+                logger.warning("No message received within 10 seconds")
+                break
+            logger.info("Received: %s", response)
             
             # Parse response
             try:
                 data = json.loads(response)
                 if "supported_assets" in data:
-                    print(f"Supported assets: {data['supported_assets']}")
+                    logger.info("Supported assets: %s", data['supported_assets'])
                 elif "error" in data:
-                    print(f"Error: {data['error']}")
-                else:
-                    print(f"Unexpected response: {data}")
+                    logger.error("Error: %s", data['error'])
             except json.JSONDecodeError:
-                print(f"Non-JSON response: {response}")
-            
-            # Send request to start engine
-            await websocket.send(json.dumps({"command": "start_engine"}))
-            print("Sent start_engine command")
-            
-            # Wait for a few messages
-            for i in range(5):
-                try:
-                    response = await asyncio.wait_for(websocket.recv(), timeout=10.0)
-                    print(f"Received: {response}")
-                except asyncio.TimeoutError:
-                    print("No message received within 10 seconds")
-                    break
-                    
+                logger.warning("Non-JSON response: %s", response)
+    finally:
+        reader_task.cancel()
+
+async def test_websocket():
+    try:
+        # No permessage-deflate on localhost, room for large frames, and a quick close on teardown
+        async with websockets.connect(URI, compression=None, max_size=2**23, ping_interval=20, close_timeout=1) as websocket:
+            logger.info("Connected to %s", URI)
+            await run_probes(websocket)
     except Exception as e:
-        print(f"Failed to connect to {uri}: {e}")
+        logger.error("Failed to connect to %s: %s", URI, e)
+
+async def _main():
+    """Run the WebSocket probes and the contract tests in one event loop."""
+    from test_contracts import test_contract_interactions
+    
+    await test_websocket()
+    await test_contract_interactions()
 
 if __name__ == "__main__":
-    asyncio.run(test_websocket())
\ No newline at end of file
+    config.configure_script_logging()
+    # --all also runs test_contracts in the same process
+    asyncio.run(_main() if "--all" in sys.argv else test_websocket())
\ No newline at end of file
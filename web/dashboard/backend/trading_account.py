@@ -5,16 +5,124 @@ Module for creating and managing a dedicated trading account
 
 import os
 import json
+import logging
+import orjson
 import time
-from dotenv import load_dotenv
+import asyncio
+import aiohttp
+import config  # Loads .env once per process
 from stellar_sdk import Keypair, Server, TransactionBuilder, Network, Asset
-from error_handler import check_account_balance
+from error_handler import check_account_balance, get_server
+from account_cache import get_account, invalidate, load_accounts_bulk, existing_trustlines
+from ratelimit import HORIZON_BUCKET, HORIZON_ASYNC_BUCKET
+from tx_cache import envelope_key, submit_cached
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
+from stellar_sdk.xdr import TransactionResult
 
-# Load environment variables
-load_dotenv()
+logger = logging.getLogger("trading")
 
 TRADING_ACCOUNT_FILE = os.path.join("data", "trading_account.json")
+FRIENDBOT_URL = "https://friendbot.stellar.org"
+NETWORK_PASSPHRASE = os.getenv('STELLAR_NETWORK_PASSPHRASE', 'Test SDF Network ; September 2015')
+# Seconds a balance read by ensure_sufficient_xlm may be reused
+BALANCE_CACHE_TTL = 10.0
+
+# Public key -> (xlm_balance, fetched_at)
+_balance_cache = {}
+
+# Shared HTTP session so repeated Friendbot calls reuse the same TLS connection
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=8,
+    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 502, 503, 504]),
+))
+
+def _has_cached_balance(public_key: str, min_balance: float) -> bool:
+    """Return True if a balance of at least min_balance was read within BALANCE_CACHE_TTL."""
+    cached = _balance_cache.get(public_key)
+    return bool(cached) and time.monotonic() - cached[1] < BALANCE_CACHE_TTL and cached[0] >= min_balance
+
+def submit_async(server: Server, tx) -> str:
+    """
+    Submit a transaction through Horizon's async endpoint without waiting for ingestion.
+    
+    Args:
+        server (Server): Horizon server to submit to
+        tx (TransactionEnvelope): The signed transaction
+        
+    Returns:
+        str: The transaction hash, to confirm later with await_txs()
+    """
+    response = _SESSION.post(f"{server.horizon_url.rstrip('/')}/transactions_async", data={"tx": tx.to_xdr()}, timeout=10)
+    result = response.json()
+    status = result.get("tx_status")
+    if status in ("PENDING", "DUPLICATE"):
+        return result["hash"]
+    
+    # Report the result code the same way Horizon's sync endpoint does, e.g. tx_bad_seq
+    reason = result.get("detail") or status
+    if result.get("error_result_xdr"):
+        code = TransactionResult.from_xdr(result["error_result_xdr"]).result.code.name
+        reason = "tx_" + code[2:].lower()
+    raise Exception(f"Async submission failed ({status}): {reason}")
+
+def _submit(server: Server, tx, pending: list = None) -> str:
+    """
+    Submit a transaction, without waiting for ingestion when pending is given.
+    
+    Args:
+        server (Server): Horizon server to submit to
+        tx (TransactionEnvelope): The signed transaction
+        pending (list): If given, submit through submit_async() and append the hash here
+        
+    Returns:
+        str: The transaction hash
+    """
+    HORIZON_BUCKET.acquire()
+    if pending is None:
+        return server.submit_transaction(tx)['hash']
+    
+    tx_hash = submit_async(server, tx)
+    pending.append(tx_hash)
+    return tx_hash
+
+def await_txs(server: Server, hashes: list, timeout: float = 60) -> dict:
+    """
+    Wait for transactions submitted with submit_async() to be ingested.
+    
+    Args:
+        server (Server): Horizon server the transactions were submitted to
+        hashes (list): Transaction hashes
+        timeout (float): Seconds to wait for all of them
+        
+    Returns:
+        dict: Transaction hash -> True if it applied successfully, False otherwise
+    """
+    deadline = time.monotonic() + timeout
+    
+    def poll(tx_hash):
+        delay = 0.2
+        while time.monotonic() < deadline:
+            try:
+                HORIZON_BUCKET.acquire()
+                response = _SESSION.get(f"{server.horizon_url.rstrip('/')}/transactions/{tx_hash}", timeout=10)
+                if response.status_code == 200:
+                    return response.json().get("successful", False)
+            except requests.exceptions.RequestException as e:
+                logger.error("Error polling transaction %s: %s", tx_hash, e)
+            time.sleep(delay)
+            delay = min(delay * 2, 0.8)
+        logger.warning("Transaction %s not confirmed within %s seconds", tx_hash, timeout)
+        return False
+    
+    if not hashes:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(8, len(hashes))) as executor:
+        return dict(zip(hashes, executor.map(poll, hashes)))
 
 def load_trading_account() -> Keypair:
     """Load the trading account keypair from file."""
@@ -26,7 +134,7 @@ def load_trading_account() -> Keypair:
             data = json.load(f)
             return Keypair.from_secret(data['secret'])
     except Exception as e:
-        print(f"Error loading trading account: {e}")
+        logger.error("Error loading trading account: %s", e)
         return None
 
 def save_trading_account(keypair: Keypair):
@@ -34,11 +142,14 @@ def save_trading_account(keypair: Keypair):
     # Create data directory if it doesn't exist
     os.makedirs(os.path.dirname(TRADING_ACCOUNT_FILE), exist_ok=True)
     
-    with open(TRADING_ACCOUNT_FILE, 'w') as f:
-        json.dump({
+    # Write to a temporary file and rename so a crash never leaves a partial file
+    tmp_file = TRADING_ACCOUNT_FILE + ".tmp"
+    with open(tmp_file, 'wb') as f:
+        f.write(orjson.dumps({
             'public_key': keypair.public_key,
             'secret': keypair.secret
-        }, f, indent=4)
+        }, option=orjson.OPT_APPEND_NEWLINE))
+    os.replace(tmp_file, TRADING_ACCOUNT_FILE)
 
 def create_trading_account() -> Keypair:
     """
@@ -47,9 +158,9 @@ def create_trading_account() -> Keypair:
     Returns:
         Keypair: The new trading account keypair
     """
-    print("Creating new trading account...")
+    logger.info("Creating new trading account...")
     keypair = Keypair.random()
-    print(f"New trading account public key: {keypair.public_key}")
+    logger.info("New trading account public key: %s", keypair.public_key)
     
     save_trading_account(keypair)
     return keypair
@@ -65,25 +176,136 @@ def fund_account_with_friendbot(public_key: str) -> bool:
         bool: True if successful, False otherwise
     """
     try:
-        print(f"Funding account {public_key} with Friendbot...")
-        response = requests.get(f"https://friendbot.stellar.org?addr={public_key}")
-        response.raise_for_status()
+        logger.info("Funding account %s with Friendbot...", public_key)
+        # Stream the response so the body is only decoded when we need to report an error
+        HORIZON_BUCKET.acquire()
+        with _SESSION.get(f"{FRIENDBOT_URL}?addr={public_key}", timeout=10, stream=True) as response:
+            response.raise_for_status()
+            
+            if response.status_code != 200:
+                logger.error("ERROR! Could not fund account. Response: \n%s", response.text)
+                return False
+            
+            # Discard the body without buffering it so the connection returns to the pool
+            for _ in response.iter_content(chunk_size=8192):
+                pass
         
-        if response.status_code == 200:
-            print(f"SUCCESS! Account {public_key} funded.")
-            # Wait a moment for the funding to propagate
-            time.sleep(2)
-            return True
-        else:
-            print(f"ERROR! Could not fund account. Response: \n{response.text}")
-            return False
+        logger.info("SUCCESS! Account %s funded.", public_key)
+        _balance_cache.pop(public_key, None)
+        return True
     except requests.exceptions.RequestException as e:
-        print(f"Network error while funding account {public_key}: {e}")
+        logger.error("Network error while funding account %s: %s", public_key, e)
         return False
     except Exception as e:
-        print(f"Error funding account {public_key}: {e}")
+        logger.error("Error funding account %s: %s", public_key, e)
         return False
 
+async def fund_accounts_with_friendbot(public_keys: list) -> dict:
+    """
+    Fund several accounts concurrently using Friendbot.
+    
+    Args:
+        public_keys (list): The public keys of the accounts to fund
+        
+    Returns:
+        dict: Mapping of public key to True if funded and visible on Horizon, False otherwise
+    """
+    semaphore = asyncio.Semaphore(8)
+    
+    async def fund(session, public_key):
+        async with semaphore:
+            try:
+                await HORIZON_ASYNC_BUCKET.acquire()
+                logger.info("Funding account %s with Friendbot...", public_key)
+                async with session.get(FRIENDBOT_URL, params={"addr": public_key}) as response:
+                    if response.status == 200:
+                        logger.info("SUCCESS! Account %s funded.", public_key)
+                        _balance_cache.pop(public_key, None)
+                        return True
+                    logger.error("ERROR! Could not fund account %s. Response: \n%s", public_key, await response.text())
+                    return False
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                logger.error("Network error while funding account %s: %s", public_key, e)
+                return False
+    
+    connector = aiohttp.TCPConnector(limit=8, keepalive_timeout=60)
+    timeout = aiohttp.ClientTimeout(total=30)
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+        results = await asyncio.gather(*(fund(session, public_key) for public_key in public_keys))
+    
+    # Wait until the funded accounts are visible on Horizon rather than sleeping a fixed time;
+    # an account Friendbot accepted but Horizon never showed is not ready to use
+    async def confirm(public_key, funded):
+        return funded and await _wait_for_account(public_key)
+    
+    visible = await asyncio.gather(*(
+        confirm(public_key, funded) for public_key, funded in zip(public_keys, results)
+    ))
+    return dict(zip(public_keys, visible))
+
+async def _wait_for_account(public_key: str) -> bool:
+    """
+    Poll Horizon with exponential backoff until a freshly funded account is visible.
+    
+    Returns:
+        bool: True if the account appeared, False if it was still missing after ~3 seconds
+    """
+    horizon_url = os.getenv('STELLAR_HORIZON_URL', 'https://horizon-testnet.stellar.org')
+    loop = asyncio.get_running_loop()
+    for delay in (0.2, 0.4, 0.8, 1.6):
+        await asyncio.sleep(delay)
+        balance_info = await loop.run_in_executor(None, check_account_balance, public_key, horizon_url)
+        if "error" not in balance_info:
+            return True
+    logger.warning("Account %s is not visible on Horizon yet", public_key)
+    return False
+
+async def fund_account_with_friendbot_async(public_key: str) -> bool:
+    """
+    Fund an account using Friendbot without blocking the event loop.
+    
+    Args:
+        public_key (str): The public key of the account to fund
+        
+    Returns:
+        bool: True if funded and visible on Horizon, False otherwise
+    """
+    results = await fund_accounts_with_friendbot([public_key])
+    return results[public_key]
+
+def _needs_funding(public_key: str, balance_info: dict, min_balance: float) -> bool:
+    """
+    Decide from a check_account_balance() result whether an account has to be funded.
+    
+    Args:
+        public_key (str): The public key of the account
+        balance_info (dict): Result of check_account_balance() for the account
+        min_balance (float): Minimum XLM balance required
+        
+    Returns:
+        bool: True if the account is missing, unreadable or below min_balance
+    """
+    if "error" in balance_info:
+        # If account not found, it needs to be funded first
+        if "not found" in balance_info['error'].lower():
+            logger.info("Account %s not found on network, funding it...", public_key)
+        else:
+            # Try to fund it anyway
+            logger.error("Error checking balance for %s: %s, funding it...", public_key, balance_info['error'])
+        return True
+        
+    current_balance = balance_info['xlm_balance']
+    _balance_cache[public_key] = (current_balance, time.monotonic())
+    logger.info("Account %s XLM balance: %s", public_key, current_balance)
+    
+    if current_balance >= min_balance:
+        logger.info("Account has sufficient XLM balance (%s >= %s)", current_balance, min_balance)
+        return False
+        
+    # If balance is too low, try to fund it
+    logger.info("Account balance (%s) is below minimum (%s), funding...", current_balance, min_balance)
+    return True
+
 def ensure_sufficient_xlm(public_key: str, min_balance: float = 20.0) -> bool:
     """
     Ensure the account has sufficient XLM balance.
@@ -95,83 +317,111 @@ def ensure_sufficient_xlm(public_key: str, min_balance: float = 20.0) -> bool:
     Returns:
         bool: True if account has sufficient balance, False otherwise
     """
+    if _has_cached_balance(public_key, min_balance):
+        return True
+    
     horizon_url = os.getenv('STELLAR_HORIZON_URL', 'https://horizon-testnet.stellar.org')
     
     try:
-        # Check current balance
-        balance_info = check_account_balance(public_key, horizon_url)
-        if "error" in balance_info:
-            # If account not found, it needs to be funded first
-            if "not found" in balance_info['error'].lower():
-                print(f"Account {public_key} not found on network, funding it...")
-                return fund_account_with_friendbot(public_key)
-            else:
-                print(f"Error checking balance for {public_key}: {balance_info['error']}")
-                # Try to fund it anyway
-                return fund_account_with_friendbot(public_key)
-            
-        current_balance = balance_info['xlm_balance']
-        print(f"Account {public_key} XLM balance: {current_balance}")
+        if not _needs_funding(public_key, check_account_balance(public_key, horizon_url), min_balance):
+            return True
+    except Exception as e:
+        # Try to fund it anyway
+        logger.error("Error checking XLM for account %s: %s", public_key, e)
+    return fund_account_with_friendbot(public_key)
+
+async def ensure_sufficient_xlm_async(public_key: str, min_balance: float = 20.0) -> bool:
+    """
+    Async variant of ensure_sufficient_xlm for callers running inside an event loop.
+    
+    Args:
+        public_key (str): The public key of the account
+        min_balance (float): Minimum XLM balance required
         
-        if current_balance >= min_balance:
-            print(f"Account has sufficient XLM balance ({current_balance} >= {min_balance})")
+    Returns:
+        bool: True if account has sufficient balance, False otherwise
+    """
+    if _has_cached_balance(public_key, min_balance):
+        return True
+    
+    horizon_url = os.getenv('STELLAR_HORIZON_URL', 'https://horizon-testnet.stellar.org')
+    loop = asyncio.get_running_loop()
+    
+    try:
+        balance_info = await loop.run_in_executor(None, check_account_balance, public_key, horizon_url)
+        if not _needs_funding(public_key, balance_info, min_balance):
             return True
-            
-        # If balance is too low, try to fund it
-        print(f"Account balance ({current_balance}) is below minimum ({min_balance}), funding...")
-        return fund_account_with_friendbot(public_key)
     except Exception as e:
-        print(f"Error checking/funding XLM for account {public_key}: {e}")
         # Try to fund it anyway
-        return fund_account_with_friendbot(public_key)
+        logger.error("Error checking XLM for account %s: %s", public_key, e)
+    return await fund_account_with_friendbot_async(public_key)
 
-def establish_trustlines(account_keypair: Keypair, assets: list) -> bool:
+def establish_trustlines(account_keypair: Keypair, assets: list, pending: list = None) -> bool:
     """
     Establish trustlines for the specified assets.
     
     Args:
         account_keypair (Keypair): The account keypair
         assets (list): List of Asset objects
+        pending (list): If given, submit without waiting for ingestion and append the hash here
         
     Returns:
         bool: True if successful, False otherwise
     """
     horizon_url = os.getenv('STELLAR_HORIZON_URL', 'https://horizon-testnet.stellar.org')
-    network_passphrase = os.getenv('STELLAR_NETWORK_PASSPHRASE', 'Test SDF Network ; September 2015')
     
-    server = Server(horizon_url)
+    server = get_server(horizon_url)
     
     try:
-        source_account = server.load_account(account_keypair.public_key)
+        source_account = get_account(server, account_keypair.public_key)
     except Exception as e:
-        print(f"Error loading account {account_keypair.public_key}: {e}")
+        logger.error("Error loading account %s: %s", account_keypair.public_key, e)
         return False
     
-    success = True
-    for asset in assets:
-        print(f"Establishing trustline for {asset.code}:{asset.issuer}...")
-        try:
-            builder = TransactionBuilder(
-                source_account=source_account,
-                network_passphrase=network_passphrase,
-                base_fee=100,
-            ).set_timeout(30)
-            
+    # Only submit trustlines the account does not already have
+    existing = existing_trustlines(source_account)
+    assets = [asset for asset in assets if (asset.code, asset.issuer) not in existing]
+    if not assets:
+        logger.info("All trustlines already established")
+        return True
+    
+    logger.info("Establishing trustlines for %s...", ', '.join(asset.code for asset in assets))
+    # Reuse the signed envelope if an earlier attempt at this sequence never applied
+    key = envelope_key(
+        account_keypair.public_key, source_account.sequence + 1, "change_trust", "10000000",
+        *(f"{asset.code}:{asset.issuer}" for asset in assets)
+    )
+    
+    def build():
+        builder = TransactionBuilder(
+            source_account=source_account,
+            network_passphrase=NETWORK_PASSPHRASE,
+            base_fee=100,
+        ).set_timeout(30)
+        
+        # Submit every trustline in one transaction instead of one per asset
+        for asset in assets:
             builder.append_change_trust_op(asset=asset, limit="10000000")
-            tx = builder.build()
-            tx.sign(account_keypair)
-            
-            response = server.submit_transaction(tx)
-            print(f"Trustline established for {asset.code}: {response['hash']}")
-        except Exception as e:
-            print(f"Error establishing trustline for {asset.code}: {e}")
-            # If trustline already exists, we can ignore the error and proceed
-            if "op_already_exists" not in str(e).lower():
-                success = False
-    
-    return success
+        tx = builder.build()
+        tx.sign(account_keypair)
+        return tx
+    
+    try:
+        tx_hash = submit_cached(
+            key, NETWORK_PASSPHRASE, account_keypair.public_key, source_account, build,
+            lambda tx: _submit(server, tx, pending)
+        )
+        if pending is not None:
+            logger.info("Trustlines submitted: %s", tx_hash)
+        else:
+            logger.info("Trustlines established: %s", tx_hash)
+        return True
+    except Exception as e:
+        logger.error("Error establishing trustlines: %s", e)
+        # If trustline already exists, we can ignore the error and proceed
+        return "op_already_exists" in str(e).lower()
 
-def distribute_assets(issuer_keypair: Keypair, recipient_keypair: Keypair, assets: list) -> bool:
+def distribute_assets(issuer_keypair: Keypair, recipient_keypair: Keypair, assets: list, pending: list = None) -> bool:
     """
     Distribute assets from issuer to recipient.
     
@@ -179,46 +429,59 @@ def distribute_assets(issuer_keypair: Keypair, recipient_keypair: Keypair, asset
         issuer_keypair (Keypair): The asset issuer keypair
         recipient_keypair (Keypair): The recipient keypair
         assets (list): List of Asset objects to distribute
+        pending (list): If given, submit without waiting for ingestion and append the hash here
         
     Returns:
         bool: True if successful, False otherwise
     """
     horizon_url = os.getenv('STELLAR_HORIZON_URL', 'https://horizon-testnet.stellar.org')
-    network_passphrase = os.getenv('STELLAR_NETWORK_PASSPHRASE', 'Test SDF Network ; September 2015')
     
-    server = Server(horizon_url)
+    server = get_server(horizon_url)
     
     try:
-        issuer_account = server.load_account(issuer_keypair.public_key)
+        issuer_account = get_account(server, issuer_keypair.public_key)
     except Exception as e:
-        print(f"Error loading issuer account {issuer_keypair.public_key}: {e}")
+        logger.error("Error loading issuer account %s: %s", issuer_keypair.public_key, e)
         return False
     
-    success = True
-    for asset in assets:
-        print(f"Distributing {asset.code} to trading account...")
-        try:
-            builder = TransactionBuilder(
-                source_account=issuer_account,
-                network_passphrase=network_passphrase,
-                base_fee=100,
-            ).set_timeout(30)
+    logger.info("Distributing %s to trading account...", ', '.join(asset.code for asset in assets))
+    # Reuse the signed envelope if an earlier attempt at this sequence never applied
+    key = envelope_key(
+        issuer_keypair.public_key, issuer_account.sequence + 1, "payment", recipient_keypair.public_key, "10000",
+        *(f"{asset.code}:{asset.issuer}" for asset in assets)
+    )
+    
+    def build():
+        builder = TransactionBuilder(
+            source_account=issuer_account,
+            network_passphrase=NETWORK_PASSPHRASE,
+            base_fee=100,
+        ).set_timeout(30)
 
+        # Submit every payment in one transaction instead of one per asset
+        for asset in assets:
             builder.append_payment_op(
                 destination=recipient_keypair.public_key,
                 asset=asset,
                 amount="10000"  # Distribute 10,000 units of each asset
             )
-            tx = builder.build()
-            tx.sign(issuer_keypair)
+        tx = builder.build()
+        tx.sign(issuer_keypair)
+        return tx
 
-            response = server.submit_transaction(tx)
-            print(f"Asset {asset.code} distributed: {response['hash']}")
-        except Exception as e:
-            print(f"Error distributing asset {asset.code}: {e}")
-            success = False
-    
-    return success
+    try:
+        tx_hash = submit_cached(
+            key, NETWORK_PASSPHRASE, issuer_keypair.public_key, issuer_account, build,
+            lambda tx: _submit(server, tx, pending)
+        )
+        if pending is not None:
+            logger.info("Asset distribution submitted: %s", tx_hash)
+        else:
+            logger.info("Assets distributed: %s", tx_hash)
+        return True
+    except Exception as e:
+        logger.error("Error distributing assets: %s", e)
+        return False
 
 def setup_trading_account(accounts: list = None) -> Keypair:
     """
@@ -230,18 +493,18 @@ def setup_trading_account(accounts: list = None) -> Keypair:
     Returns:
         Keypair: The trading account keypair
     """
-    print("Setting up dedicated trading account...")
+    logger.info("Setting up dedicated trading account...")
     
     # Load existing trading account or create new one
     trading_account = load_trading_account()
     if not trading_account:
         trading_account = create_trading_account()
     else:
-        print(f"Loaded existing trading account: {trading_account.public_key}")
+        logger.info("Loaded existing trading account: %s", trading_account.public_key)
     
     # Ensure sufficient XLM
     if not ensure_sufficient_xlm(trading_account.public_key, 20.0):
-        print("Failed to ensure sufficient XLM balance")
+        logger.error("Failed to ensure sufficient XLM balance")
         return None
     
     # Define assets
@@ -249,7 +512,7 @@ def setup_trading_account(accounts: list = None) -> Keypair:
         issuer_keypair = accounts[0]
     else:
         # If no accounts provided, we can't create assets
-        print("No issuer account provided, skipping asset distribution")
+        logger.warning("No issuer account provided, skipping asset distribution")
         return trading_account
     
     assets = [
@@ -257,23 +520,34 @@ def setup_trading_account(accounts: list = None) -> Keypair:
         Asset("USDC", issuer_keypair.public_key),
     ]
     
-    # Establish trustlines
-    print("Establishing trustlines...")
-    if not establish_trustlines(trading_account, assets):
-        print("Failed to establish all trustlines")
+    server = get_server(os.getenv('STELLAR_HORIZON_URL', 'https://horizon-testnet.stellar.org'))
+    
+    # Load the trading and issuer accounts together; establish_trustlines and
+    # distribute_assets pick them up from the account cache
+    load_accounts_bulk(server, [trading_account.public_key, issuer_keypair.public_key])
+    
+    # Establish trustlines; payments need them applied, so confirm before distributing
+    logger.info("Establishing trustlines...")
+    pending = []
+    if not establish_trustlines(trading_account, assets, pending) or not all(await_txs(server, pending).values()):
+        logger.error("Failed to establish all trustlines")
+        invalidate(trading_account.public_key)
         return trading_account
     
     # Distribute assets
-    print("Distributing assets...")
-    if not distribute_assets(issuer_keypair, trading_account, assets):
-        print("Failed to distribute all assets")
+    logger.info("Distributing assets...")
+    pending = []
+    if not distribute_assets(issuer_keypair, trading_account, assets, pending) or not all(await_txs(server, pending).values()):
+        logger.error("Failed to distribute all assets")
+        invalidate(issuer_keypair.public_key)
         return trading_account
     
-    print("Trading account setup complete!")
+    logger.info("Trading account setup complete!")
     return trading_account
 
 if __name__ == "__main__":
     # This can be run standalone to create and setup a trading account
+    config.configure_script_logging()
     from accounts import load_keypairs
     accounts = load_keypairs()
     setup_trading_account(accounts)
\ No newline at end of file
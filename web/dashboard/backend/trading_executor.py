@@ -1,143 +1,232 @@
 import time
 import os
-from dotenv import load_dotenv
-from stellar_sdk import Server, TransactionBuilder, Network, Asset, Keypair
+import functools
+import logging
+import asyncio
+from decimal import Decimal
+from concurrent.futures import ThreadPoolExecutor
+import config  # Loads .env once per process
+from stellar_sdk import Account, TransactionBuilder, Network, Asset, Keypair
 # Account import not needed
-from error_handler import check_account_balance, ensure_sufficient_fee
+from error_handler import check_account_balance, ensure_sufficient_fee, get_server
 
-# Load environment variables
-load_dotenv()
+logger = logging.getLogger("trading")
+
+# Real Reflector-tracked asset issuers
+ASSET_ISSUERS = {
+    "AQUA": "GBNZILSTVQZ4R7IKQDGHYGY2QXL5QOFJYQMXPKWRRM5PAV7Y4M67AQUA",
+    "yUSDC": "GDGTVWSM4MGS4T7Z6W4RPWOCHE2I6RDFCIFZGS3DOA63LWQTRNZNTTFF",
+    "EURC": "GDHU6WRG4IEQXM5NZ4BMPKOXHW76MZM4Y2IEMFDVXBSDP6SJY4ITNPP2",
+    "BTCLN": "GDPKQ2TSNJOFSEE7XSUXPWRP27H6GFGLWD7JCHNEYYWQVGFA543EVBVT",
+    "KALE": "GBDVX4VELCDSQ54KQJYTNHXAHFLBCA77ZY2USQBM4CSHTTV7DME7KALE",
+    "XLM": None  # Native asset, no issuer
+}
+
+@functools.lru_cache(maxsize=256)
+def _asset(code: str, issuer: str = None) -> Asset:
+    """Build an Asset once per (code, issuer) so the issuer address is only validated once."""
+    return Asset.native() if issuer is None else Asset(code, issuer)
+
+# Built once so issuer addresses are not re-validated on every trade
+ASSETS = {code: _asset(code, issuer) for code, issuer in ASSET_ISSUERS.items()}
+
+# (asset pair, fallback issuer) -> (selling asset, buying asset)
+PAIR_CACHE = {}
+
+def _resolve_pair(pair: str, fallback_issuer: str) -> tuple:
+    """
+    Resolve an "AQUA/yUSDC" style pair to its Assets, caching the result.
+    
+    Args:
+        pair: The asset pair; anything without a '/' means AQUA/yUSDC
+        fallback_issuer: Issuer used for codes missing from ASSETS
+        
+    Returns:
+        tuple: (selling_asset, buying_asset)
+    """
+    key = (pair, fallback_issuer)
+    resolved = PAIR_CACHE.get(key)
+    if resolved is None:
+        if '/' in pair:
+            selling_code, buying_code = pair.split('/')
+            # Unknown codes are treated as issued by the trader account
+            resolved = (
+                ASSETS.get(selling_code) or _asset(selling_code, fallback_issuer),
+                ASSETS.get(buying_code) or _asset(buying_code, fallback_issuer),
+            )
+        else:
+            # Default to AQUA/yUSDC
+            resolved = (ASSETS["AQUA"], ASSETS["yUSDC"])
+        PAIR_CACHE[key] = resolved
+    return resolved
+
+# Opportunity amounts and prices are fixed-point integers with 8 decimals
+AMOUNT_SCALE = 100000000
+
+def _stroops_to_str(n: int) -> str:
+    """Format a fixed-point amount exactly, e.g. 1500000 -> "0.015", without going through a float."""
+    whole, fraction = divmod(int(n), AMOUNT_SCALE)
+    return f"{whole}.{fraction:08d}".rstrip('0').rstrip('.')
+
+# Seconds a balance lookup may be reused within a trade
+BALANCE_CACHE_TTL = 0.5
+
+# Runs post-trade Horizon lookups in the background
+_EXECUTOR = ThreadPoolExecutor(max_workers=4)
 
 class TradingExecutor:
     def __init__(self):
-        self.server = Server(os.getenv('STELLAR_HORIZON_URL', 'https://horizon-testnet.stellar.org'))
+        # Shared with error_handler so every executor reuses the same HTTP connections
+        self.server = get_server(os.getenv('STELLAR_HORIZON_URL', 'https://horizon-testnet.stellar.org'))
         self.network_passphrase = os.getenv('STELLAR_NETWORK_PASSPHRASE')
+        # Public key -> (balance_info, fetched_at)
+        self._balance_cache = {}
+        # (asset pair, trader public key) -> function from compile_trader()
+        self._traders = {}
 
-    def execute_arbitrage_trade(self, trader_keypair: Keypair, opportunity: dict):
+    def _get_balance(self, public_key: str, max_age: float = BALANCE_CACHE_TTL) -> dict:
         """
-        Execute an arbitrage trade based on an opportunity.
+        Return check_account_balance() for public_key, reusing a result fetched within max_age seconds.
         
         Args:
-            trader_keypair: Keypair of the trader account
-            opportunity: Arbitrage opportunity data
-        """
-        try:
-            print(f"Executing arbitrage trade: {opportunity}")
+            public_key: The account to look up
+            max_age: Seconds a cached result stays valid
             
-            # Load trader account
-            source_account = self.server.load_account(trader_keypair.public_key)
+        Returns:
+            dict: Account balance information, or {"error": ...}
+        """
+        cached = self._balance_cache.get(public_key)
+        if cached and time.monotonic() - cached[1] < max_age:
+            return cached[0]
+        
+        balance_info = check_account_balance(public_key)
+        if "error" not in balance_info:
+            self._balance_cache[public_key] = (balance_info, time.monotonic())
+        return balance_info
+
+    def _log_balance(self, public_key: str):
+        """Log the current XLM balance of public_key at debug level."""
+        balance_info = self._get_balance(public_key)
+        if "error" not in balance_info:
+            logger.debug("Account XLM balance after trade: %s", balance_info['xlm_balance'])
+
+    def compile_trader(self, asset_pair: str, fallback_issuer: str):
+        """
+        Build a trade function specialized for one asset pair.
+        
+        The pair is parsed and its Assets resolved once here, so each call only
+        checks balances, builds, signs and submits the order.
+        
+        Args:
+            asset_pair: The asset pair, e.g. "AQUA/yUSDC"
+            fallback_issuer: Issuer used for codes missing from ASSETS
             
-            # Check account balance before executing trade
-            balance_info = check_account_balance(trader_keypair.public_key)
-            if "error" not in balance_info:
-                print(f"Account XLM balance before trade: {balance_info['xlm_balance']}")
+        Returns:
+            Callable: run(trader_keypair, opportunity) -> Horizon response or failure dict
+        """
+        selling_asset, buying_asset = _resolve_pair(asset_pair, fallback_issuer)
+        selling_code = selling_asset.code
+        network_passphrase = self.network_passphrase or 'Test SDF Network ; September 2015'
+        
+        def run(trader_keypair: Keypair, opportunity: dict):
+            try:
+                logger.info("Executing arbitrage trade: %s", opportunity)
+                
+                # One account lookup provides the sequence number and the balances for the fee
+                # and asset checks
+                balance_info = self._get_balance(trader_keypair.public_key)
+                if "error" in balance_info:
+                    logger.error("Error checking balance: %s", balance_info['error'])
+                    return {"status": "failed", "reason": balance_info['error']}
+                source_account = Account(trader_keypair.public_key, int(balance_info['sequence']))
+                
+                logger.info("Account XLM balance before trade: %s", balance_info['xlm_balance'])
                 # Ensure sufficient funds for a reasonable fee (e.g., 1000000 stroops = 0.1 XLM)
-                if not ensure_sufficient_fee(trader_keypair.public_key, 1000000):
-                    print("Warning: Insufficient funds for trade execution")
+                if not ensure_sufficient_fee(trader_keypair.public_key, 1000000, balance_info=balance_info):
+                    logger.warning("Insufficient funds for trade execution")
                     return {"status": "failed", "reason": "insufficient_funds"}
-            
-            # Extract opportunity details
-            asset_pair = opportunity.get('asset', 'AQUA/yUSDC')
-            buy_exchange = opportunity.get('buy_exchange', 'Stellar DEX')
-            sell_exchange = opportunity.get('sell_exchange', 'Reflector')
-            buy_price = opportunity.get('buy_price', 1500000)  # Default to 0.015 with 8 decimals for AQUA
-            sell_price = opportunity.get('sell_price', 1550000)  # Default to 0.0155 with 8 decimals for AQUA
-            amount = opportunity.get('available_amount', 10000000000)  # Default to 100 with 8 decimals
-            
-            # Initialize selling_code
-            selling_code = "AQUA"
-            
-            # For this simulation, we'll just create a simple buy order
-            # In a real implementation, this would involve more complex multi-step transactions
-            
-            builder = TransactionBuilder(
-                source_account=source_account,
-                network_passphrase=self.network_passphrase or 'Test SDF Network ; September 2015',
-                base_fee=100,
-            ).set_timeout(30)
-            
-            # Parse asset pair (using real Reflector-tracked assets)
-            if '/' in asset_pair:
-                selling_code, buying_code = asset_pair.split('/')
-                # Map to real asset issuers
-                asset_issuers = {
-                    "AQUA": "GBNZILSTVQZ4R7IKQDGHYGY2QXL5QOFJYQMXPKWRRM5PAV7Y4M67AQUA",
-                    "yUSDC": "GDGTVWSM4MGS4T7Z6W4RPWOCHE2I6RDFCIFZGS3DOA63LWQTRNZNTTFF",
-                    "EURC": "GDHU6WRG4IEQXM5NZ4BMPKOXHW76MZM4Y2IEMFDVXBSDP6SJY4ITNPP2",
-                    "BTCLN": "GDPKQ2TSNJOFSEE7XSUXPWRP27H6GFGLWD7JCHNEYYWQVGFA543EVBVT",
-                    "KALE": "GBDVX4VELCDSQ54KQJYTNHXAHFLBCA77ZY2USQBM4CSHTTV7DME7KALE",
-                    "XLM": None  # Native asset, no issuer
-                }
                 
-                # Create assets with proper issuers
-                if selling_code == "XLM":
-                    selling_asset = Asset.native()
-                else:
-                    selling_issuer = asset_issuers.get(selling_code, trader_keypair.public_key)
-                    selling_asset = Asset(selling_code, selling_issuer)
-                    
-                if buying_code == "XLM":
-                    buying_asset = Asset.native()
-                else:
-                    buying_issuer = asset_issuers.get(buying_code, trader_keypair.public_key)
-                    buying_asset = Asset(buying_code, buying_issuer)
-            else:
-                # Default to AQUA/yUSDC
-                selling_asset = Asset("AQUA", "GBNZILSTVQZ4R7IKQDGHYGY2QXL5QOFJYQMXPKWRRM5PAV7Y4M67AQUA")
-                buying_asset = Asset("yUSDC", "GDGTVWSM4MGS4T7Z6W4RPWOCHE2I6RDFCIFZGS3DOA63LWQTRNZNTTFF")
-            
-            # Validate that we have sufficient balance of the selling asset
-            # Use check_account_balance to get the balances
-            balance_info = check_account_balance(trader_keypair.public_key)
-            selling_asset_balance = 0
-            if "balances" in balance_info:
-                balances = balance_info["balances"]
-                # Cast to dict to help type checker
-                if isinstance(balances, dict):
-                    try:
-                        if selling_code in balances:
-                            asset_info = balances[selling_code]
-                            if isinstance(asset_info, dict) and "balance" in asset_info:
-                                selling_asset_balance = float(asset_info["balance"])
-                        elif selling_code == "XLM" and "XLM" in balances:
-                            xlm_info = balances["XLM"]
-                            if isinstance(xlm_info, dict) and "balance" in xlm_info:
-                                selling_asset_balance = float(xlm_info["balance"])
-                    except (KeyError, TypeError):
-                        # Handle case where balances is not a dictionary or key doesn't exist
-                        selling_asset_balance = 0
-            
-            required_amount = amount / 100000000  # Convert from stroops
-            if selling_asset_balance < required_amount:
-                print(f"Insufficient {selling_code} balance. Required: {required_amount}, Available: {selling_asset_balance}")
-                return {"status": "failed", "reason": "insufficient_asset_balance"}
-            
-            # Create buy order
-            builder.append_manage_buy_offer_op(
-                selling=selling_asset,
-                buying=buying_asset,
-                amount=str(amount / 100000000),  # Convert from stroops
-                price=str(buy_price / 100000000),    # Convert from stroops
-            )
-            
-            tx = builder.build()
-            tx.sign(trader_keypair)
-            
-            response = self.server.submit_transaction(tx)
-            print(f"Trade executed successfully: {response['hash']}")
-            
-            # Check account balance after trade
-            balance_info = check_account_balance(trader_keypair.public_key)
-            if "error" not in balance_info:
-                print(f"Account XLM balance after trade: {balance_info['xlm_balance']}")
-            
-            return response
-            
-        except Exception as e:
-            print(f"Error executing arbitrage trade: {e}")
-            import traceback
-            traceback.print_exc()
-            return {"status": "failed", "reason": str(e)}
+                # Extract opportunity details
+                buy_price = opportunity.get('buy_price', 1500000)  # Default to 0.015 with 8 decimals for AQUA
+                amount = opportunity.get('available_amount', 10000000000)  # Default to 100 with 8 decimals
+                
+                # Validate that we have sufficient balance of the selling asset; the balance
+                # index holds exact Decimals, so scaling it to fixed-point loses nothing
+                selling_asset_balance = balance_info["_index"].get(selling_code, Decimal(0))
+                
+                if selling_asset_balance * AMOUNT_SCALE < amount:
+                    logger.warning("Insufficient %s balance. Required: %s, Available: %s", selling_code, _stroops_to_str(amount), selling_asset_balance)
+                    return {"status": "failed", "reason": "insufficient_asset_balance"}
+                
+                # For this simulation, we'll just create a simple buy order
+                # In a real implementation, this would involve more complex multi-step transactions
+                tx = (
+                    TransactionBuilder(
+                        source_account=source_account,
+                        network_passphrase=network_passphrase,
+                        base_fee=100,
+                    )
+                    .set_timeout(30)
+                    .append_manage_buy_offer_op(
+                        selling=selling_asset,
+                        buying=buying_asset,
+                        amount=_stroops_to_str(amount),
+                        price=_stroops_to_str(buy_price),
+                    )
+                    .build()
+                )
+                tx.sign(trader_keypair)
+                
+                try:
+                    response = self.server.submit_transaction(tx)
+                finally:
+                    # Even a failed submission may have used the sequence number in the cached
+                    # account response, so it must not build the next trade
+                    self._balance_cache.pop(trader_keypair.public_key, None)
+                logger.info("Trade executed successfully: %s", response['hash'])
+                
+                # The post-trade balance is only reported when debugging, and in the background
+                # so the trade returns now.
+                if logger.isEnabledFor(logging.DEBUG):
+                    _EXECUTOR.submit(self._log_balance, trader_keypair.public_key)
+                
+                return response
+                
+            except Exception as e:
+                logger.exception("Error executing arbitrage trade: %s", e)
+                return {"status": "failed", "reason": str(e)}
+        
+        return run
+
+    def execute_arbitrage_trade(self, trader_keypair: Keypair, opportunity: dict):
+        """
+        Execute an arbitrage trade based on an opportunity.
+        
+        Args:
+            trader_keypair: Keypair of the trader account
+            opportunity: Arbitrage opportunity data
+        """
+        asset_pair = opportunity.get('asset', 'AQUA/yUSDC')
+        key = (asset_pair, trader_keypair.public_key)
+        trader = self._traders.get(key)
+        if trader is None:
+            try:
+                trader = self._traders[key] = self.compile_trader(asset_pair, trader_keypair.public_key)
+            except Exception as e:
+                logger.exception("Error executing arbitrage trade: %s", e)
+                return {"status": "failed", "reason": str(e)}
+        return trader(trader_keypair, opportunity)
+
+    async def execute_arbitrage_trade_async(self, trader_keypair: Keypair, opportunity: dict):
+        """
+        Async variant of execute_arbitrage_trade for callers running inside an event loop.
+        
+        Args:
+            trader_keypair: Keypair of the trader account
+            opportunity: Arbitrage opportunity data
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.execute_arbitrage_trade, trader_keypair, opportunity)
 
     def execute_flash_loan_arbitrage(self, trader_keypair: Keypair, opportunity: dict, flash_loan_provider: str):
         """
@@ -150,13 +239,13 @@ class TradingExecutor:
         """
         # Flash loan arbitrage would require a more complex multi-contract transaction
         # This is a simplified version for demonstration
-        print(f"Executing flash loan arbitrage: {opportunity}")
-        print("Note: Flash loan implementation requires smart contract support")
+        logger.info("Executing flash loan arbitrage: %s", opportunity)
+        logger.info("Note: Flash loan implementation requires smart contract support")
         
         # Check account balance
-        balance_info = check_account_balance(trader_keypair.public_key)
+        balance_info = self._get_balance(trader_keypair.public_key)
         if "error" not in balance_info:
-            print(f"Account XLM balance: {balance_info['xlm_balance']}")
+            logger.info("Account XLM balance: %s", balance_info['xlm_balance'])
         
         # In a real implementation, this would:
         # 1. Call the flash loan contract to borrow funds
@@ -165,5 +254,5 @@ class TradingExecutor:
         # 4. Keep the profit
         
         # For now, we'll just simulate the process
-        print("Flash loan arbitrage simulation completed")
+        logger.info("Flash loan arbitrage simulation completed")
         return {"status": "simulated", "opportunity": opportunity}
\ No newline at end of file
@@ -0,0 +1,102 @@
+"""
+In-process cache of signed transaction envelopes, so a transaction that was
+built and signed but never applied can be resubmitted without rebuilding it.
+"""
+
+import hashlib
+import time
+from stellar_sdk import TransactionEnvelope
+from account_cache import invalidate
+
+# Seconds an envelope must still be valid for to be worth resubmitting
+MIN_REMAINING_VALIDITY = 5
+
+# Key -> signed envelope XDR
+_envelope_cache = {}
+
+def envelope_key(source: str, sequence: int, *parts) -> bytes:
+    """
+    Build a content-addressed cache key for a transaction.
+    
+    Args:
+        source (str): The source account public key
+        sequence (int): The sequence number the transaction will use
+        *parts: Operation details that make the transaction unique (asset, limit, amount, ...)
+        
+    Returns:
+        bytes: The cache key
+    """
+    raw = ":".join([source, str(sequence), *map(str, parts)])
+    return hashlib.blake2b(raw.encode(), digest_size=16).digest()
+
+def get_envelope(key: bytes, network_passphrase: str):
+    """
+    Return the cached signed envelope for key.
+    
+    Args:
+        key (bytes): Key from envelope_key()
+        network_passphrase (str): Passphrase the envelope was signed for
+        
+    Returns:
+        TransactionEnvelope: The envelope, or None if missing or about to expire
+    """
+    xdr = _envelope_cache.get(key)
+    if xdr is None:
+        return None
+    
+    envelope = TransactionEnvelope.from_xdr(xdr, network_passphrase)
+    preconditions = envelope.transaction.preconditions
+    time_bounds = preconditions.time_bounds if preconditions else None
+    if time_bounds and time_bounds.max_time and time_bounds.max_time < time.time() + MIN_REMAINING_VALIDITY:
+        _envelope_cache.pop(key, None)
+        return None
+    return envelope
+
+def store_envelope(key: bytes, envelope):
+    """Cache a signed envelope under key."""
+    _envelope_cache[key] = envelope.to_xdr()
+
+def discard_envelope(key: bytes):
+    """Drop the cached envelope for key."""
+    _envelope_cache.pop(key, None)
+
+def submit_cached(key: bytes, network_passphrase: str, public_key: str, source_account, build_fn, submit_fn):
+    """
+    Submit the envelope cached under key, building, signing and caching it first if there is none.
+    
+    The envelope stays cached until it is submitted or rejected with tx_bad_seq, so an
+    attempt that failed for any other reason resubmits the same signed transaction.
+    
+    Args:
+        key (bytes): Key from envelope_key()
+        network_passphrase (str): Passphrase the envelope is signed for
+        public_key (str): The source account public key
+        source_account (Account): The source account, from account_cache.get_account()
+        build_fn (callable): Returns a new signed envelope; it advances source_account's sequence
+        submit_fn (callable): Submits an envelope and returns the result
+        
+    Returns:
+        The result of submit_fn
+        
+    Raises:
+        Exception: Whatever build_fn or submit_fn raised, after the source account was
+            dropped from the account cache
+    """
+    try:
+        tx = get_envelope(key, network_passphrase)
+        if tx is None:
+            tx = build_fn()
+            store_envelope(key, tx)
+        else:
+            # Keep the cached Account in step with a freshly built transaction
+            source_account.increment_sequence_number()
+        
+        result = submit_fn(tx)
+    except Exception as e:
+        invalidate(public_key)
+        if "tx_bad_seq" in str(e):
+            discard_envelope(key)
+        raise
+    
+    discard_envelope(key)
+    return result
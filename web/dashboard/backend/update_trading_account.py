@@ -3,8 +3,8 @@
 Script to update the trading account with a new keypair
 """
 
-import json
 import os
+import orjson
 
 def main():
     # Create data directory if it doesn't exist
@@ -17,8 +17,8 @@ def main():
     }
     
     # Save to trading account file
-    with open('data/trading_account.json', 'w') as f:
-        json.dump(keypair_data, f, indent=4)
+    with open('data/trading_account.json', 'wb') as f:
+        f.write(orjson.dumps(keypair_data, option=orjson.OPT_INDENT_2))
     
     print("Trading account updated successfully!")
 
@@ -5,68 +5,84 @@ Script to verify the trading account has been properly set up with XLM and custo
 
 import os
 import sys
+import logging
 sys.path.append(os.path.join(os.path.dirname(__file__)))
 
-from dotenv import load_dotenv
-from stellar_sdk import Keypair
-from trading_account import load_trading_account
-from error_handler import check_account_balance
-import json
+import config  # Loads .env once per process
+import orjson
 
-# Load environment variables
-load_dotenv()
+logger = logging.getLogger("verify")
 
 def load_existing_accounts():
     """Load existing accounts from keypairs file."""
+    # stellar_sdk is slow to import, so it is only loaded once there are keypairs to derive
+    from stellar_sdk import Keypair
+    
     KEYPAIRS_FILE = os.path.join("data", "keypairs.json")
     
     if not os.path.exists(KEYPAIRS_FILE):
         return []
     
     try:
-        with open(KEYPAIRS_FILE, 'r') as f:
-            data = json.load(f)
-            return [Keypair.from_secret(item['secret']) for item in data]
+        with open(KEYPAIRS_FILE, 'rb') as f:
+            data = orjson.loads(f.read())
+        return [Keypair.from_secret(item['secret']) for item in data]
     except Exception as e:
-        print(f"Error loading existing accounts: {e}")
+        logger.error("Error loading existing accounts: %s", e)
         return []
 
-def verify_account_balances(account_public_key):
-    """Verify account balances using our error handler."""
-    print(f"\nAccount: {account_public_key}")
+def verify_account_balances(account_public_key, balance_info=None):
+    """Verify account balances using our error handler, optionally with an already fetched result."""
+    logger.info("\nAccount: %s", account_public_key)
     
-    balance_info = check_account_balance(account_public_key)
+    if balance_info is None:
+        from error_handler import check_account_balance
+        balance_info = check_account_balance(account_public_key)
     if "error" in balance_info:
-        print(f"Error checking balance: {balance_info['error']}")
+        logger.error("Error checking balance: %s", balance_info['error'])
         return False
     
-    print("Balances:")
-    print(f"  XLM: {balance_info['xlm_balance']}")
+    logger.info("Balances:")
+    logger.info("  XLM: %s", balance_info['xlm_balance'])
     
-    # Print other balances if available
-    if 'balances' in balance_info:
-        for asset_code, asset_info in balance_info['balances'].items():
-            if asset_code != "XLM":
-                print(f"  {asset_code}: {asset_info['balance']}")
+    # Print other balances
+    for asset_code, asset_info in balance_info['balances'].items():
+        if asset_code != "XLM":
+            logger.info("  %s: %s", asset_code, asset_info['balance'])
     
     return True
 
 def main():
-    print("Verifying trading account setup...")
+    logger.info("Verifying trading account setup...")
+    
+    # Imported here so loading this module does not pull in stellar_sdk
+    from trading_account import load_trading_account
+    from error_handler import batch_check_account_balances
     
     # Load trading account
     trading_account = load_trading_account()
     if not trading_account:
-        print("No trading account found.")
+        logger.error("No trading account found.")
         return
     
-    print(f"Trading account public key: {trading_account.public_key}")
+    logger.info("Trading account public key: %s", trading_account.public_key)
+    
+    # Fetch the trading account and every existing account in one concurrent batch
+    other_accounts = [keypair.public_key for keypair in load_existing_accounts()]
+    balances = batch_check_account_balances(
+        [trading_account.public_key] + other_accounts,
+        os.getenv('STELLAR_HORIZON_URL', 'https://horizon-testnet.stellar.org')
+    )
     
     # Verify balances
-    if verify_account_balances(trading_account.public_key):
-        print("\nTrading account verification successful!")
+    if verify_account_balances(trading_account.public_key, balances[trading_account.public_key]):
+        logger.info("\nTrading account verification successful!")
     else:
-        print("\nTrading account verification failed!")
+        logger.error("\nTrading account verification failed!")
+    
+    for public_key in other_accounts:
+        verify_account_balances(public_key, balances[public_key])
 
 if __name__ == "__main__":
+    config.configure_script_logging()
     main()
\ No newline at end of file